@@ -10,6 +10,9 @@ from pathlib import Path
 import uuid
 from datetime import datetime
 import traceback
+from functools import lru_cache
+
+import numpy as np
 
 # Add backtesting_system to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / "backtesting_system"))
@@ -76,6 +79,139 @@ router = APIRouter()
 _backtest_results: Dict[str, Any] = {}
 
 
+# Strategy type -> class, built once at import (unknown types fall back to MA crossover)
+_STRATEGY_MAP = {
+    # Moving Average strategies
+    'ma_crossover': MovingAverageCrossover,
+
+    # RSI strategies
+    'rsi': RSIOverboughtOversold,
+    'rsi_30_70': RSI30_70,
+    'rsi_20_80': RSI20_80,
+
+    # MACD strategies
+    'macd': MACDCrossover,
+    'macd_standard': MACD_Standard,
+    'macd_zero_line': MACD_ZeroLine,
+
+    # Bollinger Band strategies
+    'bollinger': BollingerBandMeanReversion,
+    'bb_standard': BB_Standard,
+    'bb_tight': BB_Tight,
+    'bb_wide': BB_Wide,
+
+    # ADX Trend Strength strategies
+    'adx_25': ADX25,
+    'adx_30': ADX30Conservative,
+    'adx_20': ADX20Aggressive,
+
+    # Stochastic Oscillator strategies
+    'stochastic': Stochastic14_3,
+    'stochastic_14_3': Stochastic14_3,
+    'stochastic_slow': StochasticSlow,
+    'stochastic_fast': StochasticFast,
+
+    # Donchian Channel strategies
+    'donchian': Donchian20_10,
+    'donchian_20_10': Donchian20_10,
+    'donchian_50_25': Donchian50_25,
+    'donchian_10_5': Donchian10_5Fast,
+}
+
+
+# Expected types for numeric strategy parameters. JSON clients often send
+# whole numbers as floats (15.0), which breaks integer rolling windows.
+_PARAM_TYPES = {
+    # Indicator windows
+    'period': int,
+    'fast_period': int,
+    'slow_period': int,
+    'signal_period': int,
+    'trend_period': int,
+    'rsi_period': int,
+    'bb_period': int,
+    'adx_period': int,
+    'di_period': int,
+    'atr_period': int,
+    'k_period': int,
+    'd_period': int,
+    'entry_period': int,
+    'exit_period': int,
+    'lookback_period': int,
+    'vwma_period': int,
+    'price_ma_period': int,
+    'obv_ma_period': int,
+    'ad_ma_period': int,
+
+    # Thresholds and multipliers
+    'bb_std_dev': float,
+    'atr_multiplier': float,
+    'adx_threshold': float,
+    'oversold_threshold': float,
+    'overbought_threshold': float,
+    'oversold_level': float,
+    'overbought_level': float,
+    'divergence_threshold': float,
+    'position_size': float,
+    'stop_loss': float,
+    'take_profit': float,
+}
+
+
+def _coerce_parameter(key: str, value):
+    """
+    Cast one known numeric parameter to its expected type.
+
+    Raises:
+        HTTPException: 422 if the value is not a number (booleans included),
+            or is fractional for an integer parameter
+    """
+    expected = _PARAM_TYPES[key]
+    try:
+        # bool is an int subclass, so True would silently become 1
+        number = None if isinstance(value, bool) else float(value)
+    except (TypeError, ValueError):
+        number = None
+
+    if number is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Parameter '{key}' must be a number, got {value!r}"
+        )
+
+    if expected is int:
+        if not number.is_integer():
+            raise HTTPException(
+                status_code=422,
+                detail=f"Parameter '{key}' must be a whole number, got {value!r}"
+            )
+        return int(number)
+    return number
+
+
+def _coerce_parameters(parameters: dict) -> dict:
+    """Cast known numeric parameters to their expected types."""
+    return {
+        key: _coerce_parameter(key, value) if key in _PARAM_TYPES and value is not None else value
+        for key, value in parameters.items()
+    }
+
+
+@lru_cache(maxsize=8)
+def _get_engine(initial_capital: float, commission: float, slippage: float = 0.0005) -> BacktestEngine:
+    """
+    Return a shared BacktestEngine for the given settings.
+
+    BacktestEngine keeps no per-run state (run_backtest only reads its
+    configuration), so one instance per setting can serve every request.
+    """
+    return BacktestEngine(
+        initial_capital=initial_capital,
+        commission=commission,
+        slippage=slippage
+    )
+
+
 def _create_strategy_instance(strategy_config: dict):
     """
     Create a strategy instance from configuration.
@@ -87,53 +223,14 @@ def _create_strategy_instance(strategy_config: dict):
         Strategy instance
     """
     strategy_type = strategy_config.get('type', 'ma_crossover')
-    parameters = strategy_config.get('parameters', {})
+    parameters = _coerce_parameters(strategy_config.get('parameters', {}))
 
     config = {
         'name': strategy_config.get('name', 'Custom Strategy'),
         'parameters': parameters
     }
 
-    # Strategy type mapping
-    strategy_map = {
-        # Moving Average strategies
-        'ma_crossover': MovingAverageCrossover,
-
-        # RSI strategies
-        'rsi': RSIOverboughtOversold,
-        'rsi_30_70': RSI30_70,
-        'rsi_20_80': RSI20_80,
-
-        # MACD strategies
-        'macd': MACDCrossover,
-        'macd_standard': MACD_Standard,
-        'macd_zero_line': MACD_ZeroLine,
-
-        # Bollinger Band strategies
-        'bollinger': BollingerBandMeanReversion,
-        'bb_standard': BB_Standard,
-        'bb_tight': BB_Tight,
-        'bb_wide': BB_Wide,
-
-        # ADX Trend Strength strategies
-        'adx_25': ADX25,
-        'adx_30': ADX30Conservative,
-        'adx_20': ADX20Aggressive,
-
-        # Stochastic Oscillator strategies
-        'stochastic': Stochastic14_3,
-        'stochastic_14_3': Stochastic14_3,
-        'stochastic_slow': StochasticSlow,
-        'stochastic_fast': StochasticFast,
-
-        # Donchian Channel strategies
-        'donchian': Donchian20_10,
-        'donchian_20_10': Donchian20_10,
-        'donchian_50_25': Donchian50_25,
-        'donchian_10_5': Donchian10_5Fast,
-    }
-
-    strategy_class = strategy_map.get(strategy_type, MovingAverageCrossover)
+    strategy_class = _STRATEGY_MAP.get(strategy_type, MovingAverageCrossover)
     return strategy_class(config)
 
 
@@ -180,18 +277,26 @@ def _extract_signals(signals_df) -> list:
     """Extract trade signals from DataFrame."""
     trade_signals = []
 
-    for date_idx, row in signals_df.iterrows():
-        if row['signal'] != 0:
-            signal_type = SignalType.BUY if row['signal'] == 1 else SignalType.SELL
-
-            trade_signals.append(TradeSignal(
-                date=date_idx.strftime('%Y-%m-%d'),
-                signal_type=signal_type,
-                price=float(row['close']),
-                shares=None,  # Would need to track from portfolio
-                position_value=None,
-                reason=f"{'Buy' if row['signal'] == 1 else 'Sell'} signal generated"
-            ))
+    # Locate all non-zero signals in one pass instead of visiting every row
+    signal_positions = np.flatnonzero(signals_df['signal'].to_numpy())
+    signal_rows = signals_df.iloc[signal_positions]
+
+    # Format all dates in one vectorized call rather than per row
+    dates = signal_rows.index.strftime('%Y-%m-%d')
+
+    for date_str, signal, price in zip(
+        dates, signal_rows['signal'].to_numpy(), signal_rows['close'].to_numpy()
+    ):
+        signal_type = SignalType.BUY if signal == 1 else SignalType.SELL
+
+        trade_signals.append(TradeSignal(
+            date=date_str,
+            signal_type=signal_type,
+            price=float(price),
+            shares=None,  # Would need to track from portfolio
+            position_value=None,
+            reason=f"{'Buy' if signal == 1 else 'Sell'} signal generated"
+        ))
 
     return trade_signals
 
@@ -234,19 +339,21 @@ def _extract_equity_curve(portfolio_history) -> list:
     equity_points = []
 
     # Calculate peak for drawdown
-    peak = portfolio_history['portfolio_value'].expanding().max()
+    values = portfolio_history['portfolio_value'].to_numpy()
+    peaks = portfolio_history['portfolio_value'].expanding().max().to_numpy()
+    dates = portfolio_history.index.strftime('%Y-%m-%d')
 
-    for date_idx, row in portfolio_history.iterrows():
-        current_value = row['portfolio_value']
-        current_peak = peak.loc[date_idx]
+    for date_str, current_value, cash, current_peak in zip(
+        dates, values, portfolio_history['cash'].to_numpy(), peaks
+    ):
         drawdown = current_peak - current_value
         drawdown_pct = (drawdown / current_peak * 100) if current_peak > 0 else 0
 
         equity_points.append(EquityPoint(
-            date=date_idx.strftime('%Y-%m-%d'),
+            date=date_str,
             portfolio_value=float(current_value),
-            cash=float(row['cash']),
-            position_value=float(current_value - row['cash']),
+            cash=float(cash),
+            position_value=float(current_value - cash),
             drawdown=float(drawdown),
             drawdown_pct=float(drawdown_pct)
         ))
@@ -268,6 +375,9 @@ async def _run_backtest_task(
         _backtest_results[backtest_id]['status'] = 'running'
         _backtest_results[backtest_id]['progress'] = 0.1
 
+        # Create strategy instance (invalid parameters fail before the download)
+        strategy = _create_strategy_instance(request.strategy.dict())
+
         # Fetch stock data
         data = fetch_stock_data(
             symbol=request.symbol,
@@ -276,19 +386,10 @@ async def _run_backtest_task(
             interval='1d'
         )
 
-        _backtest_results[backtest_id]['progress'] = 0.3
-
-        # Create strategy instance
-        strategy = _create_strategy_instance(request.strategy.dict())
-
         _backtest_results[backtest_id]['progress'] = 0.4
 
-        # Create backtest engine
-        engine = BacktestEngine(
-            initial_capital=request.initial_capital,
-            commission=request.commission,
-            slippage=0.0005  # Default slippage
-        )
+        # Shared backtest engine for these settings
+        engine = _get_engine(request.initial_capital, request.commission)
 
         _backtest_results[backtest_id]['progress'] = 0.5
 
@@ -334,6 +435,12 @@ async def _run_backtest_task(
         _backtest_results[backtest_id]['progress'] = 1.0
         _backtest_results[backtest_id]['result'] = backtest_result
 
+    except HTTPException as e:
+        # Invalid request: record the failure and let the endpoint return it
+        _backtest_results[backtest_id]['status'] = 'failed'
+        _backtest_results[backtest_id]['error'] = e.detail
+        raise
+
     except Exception as e:
         # Handle errors
         error_msg = f"{str(e)}\n{traceback.format_exc()}"
@@ -379,6 +486,9 @@ async def run_backtest(request: BacktestRequest, background_tasks: BackgroundTas
             message="Backtest completed" if _backtest_results[backtest_id]['status'] == 'completed' else "Backtest started"
         )
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -508,16 +618,16 @@ async def list_all_backtests():
 
     Useful for debugging and seeing backtest history.
     """
-    backtests = []
-
-    for backtest_id, data in _backtest_results.items():
-        backtests.append({
+    backtests = [
+        {
             'backtest_id': backtest_id,
             'status': data['status'],
             'created_at': data['created_at'],
             'symbol': data['result'].symbol if data.get('result') else None,
             'strategy': data['result'].strategy.name if data.get('result') else None
-        })
+        }
+        for backtest_id, data in _backtest_results.items()
+    ]
 
     return {'backtests': backtests, 'total': len(backtests)}
 
@@ -554,6 +664,9 @@ async def run_batch_backtest(request: BatchBacktestRequest):
         try:
             print(f"Running backtest for {item.symbol} with strategy {item.strategy.name}")
 
+            # Create strategy instance (invalid parameters fail before the download)
+            strategy = _create_strategy_instance(item.strategy.dict())
+
             # Fetch data
             data = fetch_stock_data(
                 symbol=item.symbol,
@@ -565,15 +678,8 @@ async def run_batch_backtest(request: BatchBacktestRequest):
             last_close = float(data['close'].iloc[-1])
             print(f"Fetched {len(data)} bars for {item.symbol}, first close={first_close:.2f}, last close={last_close:.2f}")
 
-            # Create strategy instance
-            strategy = _create_strategy_instance(item.strategy.dict())
-
-            # Create backtest engine
-            engine = BacktestEngine(
-                initial_capital=request.initial_capital,
-                commission=request.commission,
-                slippage=0.0005
-            )
+            # Shared backtest engine for these settings
+            engine = _get_engine(request.initial_capital, request.commission)
 
             # Run backtest (make a copy to avoid data mutation issues)
             result = engine.run_backtest(
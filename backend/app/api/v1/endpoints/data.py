@@ -137,14 +137,17 @@ async def get_stock_ohlcv(request: StockDataRequest):
 
         # Convert DataFrame to list of OHLCV objects
         data_points = []
-        for date_idx, row in df.iterrows():
+        dates = df.index.strftime('%Y-%m-%d')
+        ohlcv = df[['open', 'high', 'low', 'close', 'volume']].itertuples(index=False, name=None)
+
+        for date_str, (open_, high, low, close, volume) in zip(dates, ohlcv):
             data_points.append(OHLCVData(
-                date=date_idx.strftime('%Y-%m-%d'),
-                open=float(row['open']),
-                high=float(row['high']),
-                low=float(row['low']),
-                close=float(row['close']),
-                volume=int(row['volume'])
+                date=date_str,
+                open=float(open_),
+                high=float(high),
+                low=float(low),
+                close=float(close),
+                volume=int(volume)
             ))
 
         return StockDataResponse(
@@ -6,9 +6,10 @@ A strategy-agnostic backtesting engine that works with any asset type
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 
 @dataclass
@@ -24,6 +25,9 @@ class BacktestResult:
         trades: List of executed trades
         metrics: Performance metrics
         metadata: Additional metadata (dates, parameters, etc.)
+
+    The signals_arr, equity_arr and dates_arr properties expose the same
+    columns as NumPy arrays for consumers that do not need pandas.
     """
     ticker: str
     strategy_name: str
@@ -33,6 +37,21 @@ class BacktestResult:
     metrics: Any  # PerformanceMetrics object
     metadata: Dict[str, Any]
 
+    @property
+    def signals_arr(self) -> np.ndarray:
+        """Signal column as an int64 NumPy array (1 = buy, -1 = sell, 0 = hold)."""
+        return self.signals['signal'].to_numpy(dtype=np.int64)
+
+    @property
+    def equity_arr(self) -> np.ndarray:
+        """Portfolio value over time as a NumPy array."""
+        return self.portfolio_history['portfolio_value'].to_numpy()
+
+    @property
+    def dates_arr(self) -> np.ndarray:
+        """Bar dates as a datetime64 NumPy array."""
+        return self.signals.index.to_numpy()
+
 
 class BacktestEngine:
     """
@@ -108,6 +127,10 @@ class BacktestEngine:
         # Setup strategy
         strategy.setup(data)
 
+        # Check any shared indicators against this data once, up front
+        if hasattr(strategy, 'prepare_precomputed'):
+            strategy.prepare_precomputed(data)
+
         # Generate signals
         signals = strategy.generate_signals(data.copy())
 
@@ -156,7 +179,9 @@ class BacktestEngine:
         self,
         strategy,
         assets_data: Dict[str, pd.DataFrame],
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        max_workers: int = 1,
+        callback: Optional[Callable[[str, BacktestResult], None]] = None
     ) -> Dict[str, BacktestResult]:
         """
         Run backtests on multiple assets with the same strategy.
@@ -165,21 +190,65 @@ class BacktestEngine:
             strategy: Strategy instance
             assets_data: Dictionary mapping ticker -> OHLCV DataFrame
             metadata: Additional metadata
+            max_workers: Number of worker processes (1 = run sequentially)
+            callback: Optional function called with (ticker, result) as soon as
+                each asset finishes (in completion order when parallel)
 
         Returns:
-            Dictionary mapping ticker -> BacktestResult
+            Dictionary mapping ticker -> BacktestResult (in input order)
         """
+        if max_workers > 1 and len(assets_data) > 1:
+            return self._run_multi_asset_parallel(strategy, assets_data, metadata, max_workers, callback)
+
         results = {}
 
         for ticker, data in assets_data.items():
+            # run_backtest fills in per-asset fields, so give each its own copy
             result = self.run_backtest(
                 strategy=strategy,
                 data=data,
                 ticker=ticker,
-                metadata=metadata
+                metadata=dict(metadata) if metadata is not None else None
             )
             results[ticker] = result
 
+            if callback is not None:
+                callback(ticker, result)
+
+        return results
+
+    def _run_multi_asset_parallel(
+        self,
+        strategy,
+        assets_data: Dict[str, pd.DataFrame],
+        metadata: Optional[Dict[str, Any]],
+        max_workers: int,
+        callback: Optional[Callable[[str, BacktestResult], None]]
+    ) -> Dict[str, BacktestResult]:
+        """Run one strategy over several assets across worker processes."""
+        workers = min(max_workers, len(assets_data))
+
+        # Pre-seed keys so results keep input order while arriving out of order
+        results = dict.fromkeys(assets_data)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_asset_worker,
+            initargs=(self, strategy, metadata)
+        ) as executor:
+            # Each asset's data is sent only to the worker that backtests it
+            futures = {
+                executor.submit(_run_asset_worker, asset): asset[0]
+                for asset in assets_data.items()
+            }
+
+            for future in as_completed(futures):
+                ticker = futures[future]
+                results[ticker] = future.result()
+
+                if callback is not None:
+                    callback(ticker, results[ticker])
+
         return results
 
     def _validate_data(self, data: pd.DataFrame) -> None:
@@ -203,7 +272,9 @@ class BacktestEngine:
 
         Returns DataFrame with portfolio state at each timestamp.
         """
-        df = signals_df.copy()
+        # Shallow copy: only whole columns are (re)assigned below, which never
+        # writes into the caller's arrays, so the price data needn't be duplicated
+        df = signals_df.copy(deep=False)
 
         # Initialize portfolio state
         cash = self.initial_capital
@@ -321,15 +392,98 @@ class BacktestEngine:
         return trades
 
 
+def _run_with_indicators(
+    engine: BacktestEngine,
+    strategy,
+    data: pd.DataFrame,
+    ticker: str,
+    indicators: Optional[Dict[Tuple, Any]]
+) -> BacktestResult:
+    """
+    Run one backtest with a shared indicator cache attached.
+
+    The strategy's own cache, if the caller attached one, is restored
+    afterwards.
+    """
+    if not indicators or not hasattr(strategy, 'use_precomputed'):
+        return engine.run_backtest(strategy=strategy, data=data, ticker=ticker)
+
+    previous = getattr(strategy, 'precomputed', {})
+    strategy.use_precomputed(indicators)
+    try:
+        return engine.run_backtest(strategy=strategy, data=data, ticker=ticker)
+    finally:
+        strategy.use_precomputed(previous)
+
+
+# Per-process state for parallel strategy runs. The pool initializer sets
+# these once per worker so the shared DataFrame and indicator cache are
+# pickled once per worker instead of once per task.
+_worker_engine: Optional[BacktestEngine] = None
+_worker_data: Optional[pd.DataFrame] = None
+_worker_ticker: str = "UNKNOWN"
+_worker_indicators: Optional[Dict[Tuple, Any]] = None
+
+
+def _init_strategy_worker(
+    engine: BacktestEngine,
+    data: pd.DataFrame,
+    ticker: str,
+    indicators: Optional[Dict[Tuple, Any]]
+) -> None:
+    """Pool initializer: store the engine, shared data and indicators in the worker."""
+    global _worker_engine, _worker_data, _worker_ticker, _worker_indicators
+    _worker_engine = engine
+    _worker_data = data
+    _worker_ticker = ticker
+    _worker_indicators = indicators
+
+
+def _run_strategy_worker(strategy) -> BacktestResult:
+    """Run one strategy against the worker's shared data."""
+    return _run_with_indicators(
+        _worker_engine, strategy, _worker_data, _worker_ticker, _worker_indicators
+    )
+
+
+# Per-worker state for run_multi_asset_backtest(max_workers > 1): the engine
+# and strategy are shared by every asset, so send them once per worker.
+_worker_strategy = None
+_worker_metadata: Optional[Dict[str, Any]] = None
+
+
+def _init_asset_worker(engine: BacktestEngine, strategy, metadata: Optional[Dict[str, Any]]) -> None:
+    """Pool initializer: store the engine, strategy and metadata in the worker."""
+    global _worker_engine, _worker_strategy, _worker_metadata
+    _worker_engine = engine
+    _worker_strategy = strategy
+    _worker_metadata = metadata
+
+
+def _run_asset_worker(asset) -> BacktestResult:
+    """Run the worker's strategy against one (ticker, data) pair."""
+    ticker, data = asset
+    return _worker_engine.run_backtest(
+        strategy=_worker_strategy,
+        data=data,
+        ticker=ticker,
+        metadata=dict(_worker_metadata) if _worker_metadata is not None else None
+    )
+
+
 class MultiStrategyBacktest:
     """
     Run backtests comparing multiple strategies on the same data.
 
+    Strategies are independent of each other, so they can optionally be
+    spread across worker processes with ``max_workers``.
+
     Example:
         comparator = MultiStrategyBacktest(
             strategies=[strategy1, strategy2, strategy3],
             data=price_data,
-            ticker='AAPL'
+            ticker='AAPL',
+            max_workers=3
         )
 
         results = comparator.run()
@@ -341,7 +495,8 @@ class MultiStrategyBacktest:
         data: pd.DataFrame,
         ticker: str = "UNKNOWN",
         initial_capital: float = 100000.0,
-        commission: float = 0.001
+        commission: float = 0.001,
+        max_workers: int = 1
     ):
         """
         Initialize multi-strategy backtest.
@@ -352,10 +507,12 @@ class MultiStrategyBacktest:
             ticker: Asset ticker
             initial_capital: Starting capital
             commission: Commission rate
+            max_workers: Number of worker processes (1 = run sequentially)
         """
         self.strategies = strategies
         self.data = data
         self.ticker = ticker
+        self.max_workers = max_workers
         self.engine = BacktestEngine(
             initial_capital=initial_capital,
             commission=commission
@@ -367,15 +524,45 @@ class MultiStrategyBacktest:
 
         Returns:
             Dictionary mapping strategy name -> BacktestResult
+            (in the same order as the strategies were given)
         """
+        shared = self._share_indicators()
+
+        if self.max_workers > 1 and len(self.strategies) > 1:
+            return self._run_parallel(shared)
+
         results = {}
 
         for strategy in self.strategies:
-            result = self.engine.run_backtest(
-                strategy=strategy,
-                data=self.data,
-                ticker=self.ticker
-            )
+            result = _run_with_indicators(self.engine, strategy, self.data, self.ticker, shared)
             results[strategy.name] = result
 
         return results
+
+    def _share_indicators(self) -> Optional[Dict[Tuple, Any]]:
+        """Compute indicators needed by several strategies once, for sharing."""
+        from app.services.strategy.indicators import precompute
+
+        keys = [
+            key
+            for strategy in self.strategies
+            if hasattr(strategy, 'required_indicators')
+            for key in strategy.required_indicators()
+        ]
+        if not keys:
+            return None
+
+        return precompute(self.data, keys)
+
+    def _run_parallel(self, shared: Optional[Dict[Tuple, Any]]) -> Dict[str, BacktestResult]:
+        """Run strategies across worker processes, preserving input order."""
+        workers = min(self.max_workers, len(self.strategies))
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_strategy_worker,
+            initargs=(self.engine, self.data, self.ticker, shared)
+        ) as executor:
+            # executor.map yields in submission order, so reports stay deterministic
+            results = executor.map(_run_strategy_worker, self.strategies)
+            return {result.strategy_name: result for result in results}
@@ -9,6 +9,7 @@ from .market_data import (
     fetch_demo_stock,
     load_csv_data
 )
+from .shared_ohlcv import share_ohlcv, attach_ohlcv
 
 __all__ = [
     'fetch_stock_data',
@@ -18,5 +19,7 @@ __all__ = [
     'validate_data_quality',
     'get_date_range_suggestion',
     'fetch_demo_stock',
-    'load_csv_data'
+    'load_csv_data',
+    'share_ohlcv',
+    'attach_ohlcv'
 ]
@@ -5,11 +5,16 @@ Utility functions to fetch real-world market data from various sources.
 Currently supports Yahoo Finance via yfinance library and CSV files.
 """
 import pandas as pd
-import yfinance as yf
+import numpy as np
 from typing import Optional, Tuple, Dict, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from pathlib import Path
 import os
+import pickle
+
+
+# On-disk cache for fetch_demo_stock results (backend/output/cache)
+DEMO_CACHE_DIR = Path(__file__).resolve().parents[3] / 'output' / 'cache'
 
 
 def fetch_stock_data(
@@ -42,6 +47,9 @@ def fetch_stock_data(
         import warnings
         warnings.filterwarnings('ignore')
 
+        # yfinance is slow to import, so load it only when actually fetching
+        import yfinance as yf
+
         # Create ticker object
         ticker = yf.Ticker(symbol)
 
@@ -140,6 +148,8 @@ def get_stock_info(symbol: str) -> Dict[str, any]:
         >>> print(info['longName'])  # 'Apple Inc.'
     """
     try:
+        import yfinance as yf
+
         ticker = yf.Ticker(symbol)
         info = ticker.info
         return {
@@ -208,11 +218,12 @@ def validate_data_quality(data: pd.DataFrame, symbol: str = "Stock") -> Tuple[bo
 
     # Check for gaps in dates (assuming daily data)
     if len(data) > 1:
-        date_diffs = data.index.to_series().diff()[1:]
-        large_gaps = date_diffs[date_diffs > pd.Timedelta(days=5)]  # More than 5 days gap
+        # Count gaps directly rather than materializing the gap rows
+        date_diffs = np.diff(data.index.values)
+        large_gaps = int(np.count_nonzero(date_diffs > np.timedelta64(5, 'D')))  # More than 5 days gap
 
-        if len(large_gaps) > 0:
-            issues.append(f"⚠️  Warning: {len(large_gaps)} date gaps larger than 5 days")
+        if large_gaps > 0:
+            issues.append(f"⚠️  Warning: {large_gaps} date gaps larger than 5 days")
 
     # Check for zero volume days
     zero_volume_days = (data['volume'] == 0).sum()
@@ -337,17 +348,68 @@ def load_csv_data(
         raise ValueError(f"Error loading CSV data: {str(e)}")
 
 
+def _demo_cache_path(symbol: str, years_back: int) -> Path:
+    """Cache file for a demo fetch; the day is part of the key so data refreshes daily."""
+    return DEMO_CACHE_DIR / f"{symbol}_{years_back}_{date.today().isoformat()}.pkl"
+
+
+def _load_demo_cache(cache_path: Path) -> Optional[Tuple[pd.DataFrame, Dict[str, any]]]:
+    """Load a cached (data, info) pair, or None if missing or unreadable."""
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, 'rb') as f:
+            data, info = pickle.load(f)
+    except Exception:
+        # Truncated, corrupt or written by an incompatible version: the
+        # caller fetches again and the next save replaces the file
+        return None
+
+    if not isinstance(data, pd.DataFrame) or not isinstance(info, dict):
+        return None
+    return data, info
+
+
+def _save_demo_cache(
+    cache_path: Path,
+    symbol: str,
+    years_back: int,
+    data: pd.DataFrame,
+    info: Dict[str, any]
+) -> None:
+    """Persist a (data, info) pair and drop stale entries for the same key."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        for stale in cache_path.parent.glob(f"{symbol}_{years_back}_*.pkl"):
+            if stale != cache_path:
+                stale.unlink()
+
+        with open(cache_path, 'wb') as f:
+            pickle.dump((data, info), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # Caching is best-effort; a read-only checkout should still work
+        pass
+
+
 # Convenience function for demo
 def fetch_demo_stock(
     symbol: str = 'AAPL',
-    years_back: int = 2
+    years_back: int = 2,
+    use_cache: bool = False
 ) -> Tuple[pd.DataFrame, Dict[str, any]]:
     """
     Fetch stock data for demo purposes with automatic date range.
 
+    With use_cache=True, successful Yahoo Finance fetches are cached on disk
+    (DEMO_CACHE_DIR) for the rest of the day, so repeated demo runs skip the
+    network round-trip. An unreadable cache file is ignored and refetched.
+
     Args:
         symbol: Stock ticker symbol (default: 'AAPL')
         years_back: Years of historical data (default: 2)
+        use_cache: Read/write the on-disk cache (default: False)
 
     Returns:
         Tuple of (data DataFrame, stock info dict)
@@ -356,6 +418,15 @@ def fetch_demo_stock(
         >>> data, info = fetch_demo_stock('AAPL', years_back=2)
         >>> print(f"Fetched {len(data)} days of {info['name']} data")
     """
+    cache_path = _demo_cache_path(symbol, years_back)
+
+    if use_cache:
+        cached = _load_demo_cache(cache_path)
+        if cached is not None:
+            data, info = cached
+            print(f"📊 Loaded {symbol} data from cache ({len(data)} days)")
+            return data, info
+
     start_date, end_date = get_date_range_suggestion(years_back)
 
     # First, try to fetch from Yahoo Finance
@@ -376,6 +447,9 @@ def fetch_demo_stock(
         print(f"   ✓ Successfully fetched {len(data)} days from Yahoo Finance")
         print(f"   ✓ Price range: ${data['close'].min():.2f} - ${data['close'].max():.2f}")
 
+        if use_cache:
+            _save_demo_cache(cache_path, symbol, years_back, data, info)
+
         return data, info
 
     except Exception as e:
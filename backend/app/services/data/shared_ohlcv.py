@@ -0,0 +1,111 @@
+"""
+Shared-Memory OHLCV Frames
+
+Hands one OHLCV DataFrame to many worker processes without pickling a copy
+per worker. The parent copies the date index and each column into a single
+shared memory block once; workers map the block and rebuild a DataFrame
+whose columns are NumPy views over the shared bytes.
+"""
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Column offsets are rounded up to this many bytes so every view is aligned
+_ALIGNMENT = 64
+
+# Layout entry that holds the date index, so no column may use this name
+_INDEX_ENTRY = 'index'
+
+# NumPy dtype kinds that can be shared as raw bytes (bool, int, uint, float)
+_NUMERIC_KINDS = 'biuf'
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def share_ohlcv(data: pd.DataFrame) -> Tuple[SharedMemory, Dict[str, Any]]:
+    """
+    Copy a DataFrame's index and columns into a new shared memory block.
+
+    The caller owns the block: call close() and unlink() on it once every
+    worker is done.
+
+    Args:
+        data: DataFrame with a DatetimeIndex and numeric columns
+
+    Returns:
+        Tuple of (shared memory block, spec). The spec is a small picklable
+        dict to pass to attach_ohlcv() in the workers.
+
+    Raises:
+        ValueError: If the index is not a DatetimeIndex, a column is not
+            numeric (object columns hold pointers that are meaningless in
+            another process) or a column is named 'index'
+    """
+    if not isinstance(data.index, pd.DatetimeIndex):
+        raise ValueError("share_ohlcv requires a DatetimeIndex")
+
+    # .values is tz-naive (UTC for tz-aware indexes); the tz is restored on attach
+    arrays = {_INDEX_ENTRY: np.ascontiguousarray(data.index.values)}
+    for col in data.columns:
+        if col == _INDEX_ENTRY:
+            raise ValueError(f"share_ohlcv cannot share a column named '{_INDEX_ENTRY}'")
+
+        arr = np.ascontiguousarray(data[col].to_numpy())
+        if arr.dtype.kind not in _NUMERIC_KINDS:
+            raise ValueError(
+                f"share_ohlcv requires numeric columns, got {arr.dtype} for '{col}'"
+            )
+        arrays[col] = arr
+
+    layout = []
+    offset = 0
+    for name, arr in arrays.items():
+        offset = _aligned(offset)
+        layout.append((name, arr.dtype.str, offset))
+        offset += arr.nbytes
+
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    for (name, dtype, start), arr in zip(layout, arrays.values()):
+        np.ndarray(arr.shape, dtype=dtype, buffer=shm.buf, offset=start)[:] = arr
+
+    spec = {
+        'name': shm.name,
+        'length': len(data),
+        'layout': layout,
+        'index_name': data.index.name,
+        'tz': data.index.tz
+    }
+    return shm, spec
+
+
+def attach_ohlcv(spec: Dict[str, Any]) -> Tuple[SharedMemory, pd.DataFrame]:
+    """
+    Rebuild a DataFrame shared by share_ohlcv() without copying its columns.
+
+    The columns are read-only views into the block, so keep the returned
+    SharedMemory open for as long as the DataFrame is in use.
+
+    Args:
+        spec: Spec returned by share_ohlcv()
+
+    Returns:
+        Tuple of (attached shared memory block, DataFrame)
+    """
+    shm = SharedMemory(name=spec['name'])
+    length = spec['length']
+
+    arrays = {}
+    for name, dtype, start in spec['layout']:
+        arr = np.ndarray((length,), dtype=dtype, buffer=shm.buf, offset=start)
+        arr.flags.writeable = False
+        arrays[name] = arr
+
+    index = pd.DatetimeIndex(arrays.pop(_INDEX_ENTRY), name=spec['index_name'])
+    if spec['tz'] is not None:
+        index = index.tz_localize('UTC').tz_convert(spec['tz'])
+
+    return shm, pd.DataFrame(arrays, index=index, copy=False)
@@ -24,6 +24,7 @@ from .strategy_types import (
 # Factory pattern
 from .strategy_factory import (
     StrategyFactory,
+    StrategyInfo,
     get_factory,
     create_strategy,
     list_strategies,
@@ -54,6 +55,7 @@ __all__ = [
 
     # Factory
     'StrategyFactory',
+    'StrategyInfo',
     'get_factory',
     'create_strategy',
     'list_strategies',
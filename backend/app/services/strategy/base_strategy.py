@@ -4,7 +4,7 @@ Base Strategy Class
 This module provides the abstract base class that all trading strategies must inherit from.
 It defines the interface and default implementations for strategy behavior.
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import pandas as pd
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -60,6 +60,11 @@ class Strategy(ABC):
         self.created_at = datetime.now()
         self.indicators: List[str] = []
 
+        # Indicators shared by a caller, keyed like ('sma', 20), and the
+        # subset verified against the data being backtested
+        self.precomputed: Dict[Tuple, Any] = {}
+        self._precomputed_for_data: Dict[Tuple, Any] = {}
+
         # Position sizing defaults
         self.default_position_size = self.parameters.get('position_size', 0.1)  # 10% of portfolio
 
@@ -269,6 +274,73 @@ class Strategy(ABC):
                 f"got {len(data)}"
             )
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicator keys this strategy can take from a shared precomputed cache.
+
+        Override in subclasses that look indicators up with get_precomputed().
+        Keys are tuples such as ('sma', 20), ('rsi', 14) or ('macd', 12, 26, 9);
+        see indicators.precompute() for the supported kinds.
+
+        Returns:
+            List of indicator keys (default: none)
+        """
+        return []
+
+    def use_precomputed(self, indicators: Dict[Tuple, Any]) -> 'Strategy':
+        """
+        Share indicator series computed once for several strategies.
+
+        The cache is only used after prepare_precomputed() has checked it
+        against the data, which BacktestEngine.run_backtest() does.
+
+        Args:
+            indicators: Mapping of indicator key -> Series (or tuple of Series)
+                aligned with the data, as built by indicators.precompute();
+                pass {} to drop a previously shared cache
+
+        Returns:
+            self, for chaining
+        """
+        self.precomputed = indicators
+        self._precomputed_for_data = {}
+        return self
+
+    def prepare_precomputed(self, data: pd.DataFrame) -> None:
+        """
+        Check the shared indicators against the data about to be traded.
+
+        Done once per backtest so get_precomputed() stays a dict lookup.
+        Caches from precompute() are compared with their source bars; plain
+        dicts can only be checked against the index.
+
+        Args:
+            data: DataFrame the strategy will generate signals for
+        """
+        matches = getattr(self.precomputed, 'matches', None)
+        if matches is not None:
+            self._precomputed_for_data = self.precomputed if matches(data) else {}
+            return
+
+        self._precomputed_for_data = {
+            key: value
+            for key, value in self.precomputed.items()
+            if (value[0] if isinstance(value, tuple) else value).index.equals(data.index)
+        }
+
+    def get_precomputed(self, key: Tuple) -> Optional[Any]:
+        """
+        Look up a shared indicator for the data being backtested.
+
+        Args:
+            key: Indicator key, e.g. ('sma', 20)
+
+        Returns:
+            The cached Series (or tuple of Series for multi-output indicators),
+            or None if missing or not checked against this data
+        """
+        return self._precomputed_for_data.get(key)
+
     def __repr__(self) -> str:
         """String representation of the strategy."""
         return f"{self.__class__.__name__}(name='{self.name}', version='{self.version}')"
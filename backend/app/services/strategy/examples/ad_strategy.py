@@ -7,7 +7,7 @@ relative to the high-low range.
 
 Rising A/D suggests accumulation (buying pressure), falling A/D suggests distribution (selling pressure).
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 from app.services.strategy.base_strategy import Strategy
 from app.services.strategy.indicators import accumulation_distribution, sma, ema
@@ -33,15 +33,23 @@ class ADTrendConfirmation(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('ad',), ('sma', self.price_ma_period)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on A/D trend confirmation."""
         df = data.copy()
 
-        # Calculate A/D Line
-        df['ad_line'] = accumulation_distribution(df['high'], df['low'], df['close'], df['volume'])
+        # Calculate A/D Line (unless shared)
+        ad_line = self.get_precomputed(('ad',))
+        if ad_line is None:
+            ad_line = accumulation_distribution(df['high'], df['low'], df['close'], df['volume'])
+        df['ad_line'] = ad_line
 
         # Calculate moving averages
-        df['price_ma'] = sma(df['close'], self.price_ma_period)
+        price_ma = self.get_precomputed(('sma', self.price_ma_period))
+        df['price_ma'] = price_ma if price_ma is not None else sma(df['close'], self.price_ma_period)
         df['ad_ma'] = sma(df['ad_line'], self.ad_ma_period)
 
         # Previous values for trend detection
@@ -84,12 +92,19 @@ class ADDivergence(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('ad',)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on A/D divergences."""
         df = data.copy()
 
-        # Calculate A/D Line
-        df['ad_line'] = accumulation_distribution(df['high'], df['low'], df['close'], df['volume'])
+        # Calculate A/D Line (unless shared)
+        ad_line = self.get_precomputed(('ad',))
+        if ad_line is None:
+            ad_line = accumulation_distribution(df['high'], df['low'], df['close'], df['volume'])
+        df['ad_line'] = ad_line
 
         # Calculate rolling lows and highs
         df['price_low'] = df['close'].rolling(window=self.lookback_period).min()
@@ -141,12 +156,19 @@ class ADCrossover(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('ad',)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on A/D crossovers."""
         df = data.copy()
 
-        # Calculate A/D Line
-        df['ad_line'] = accumulation_distribution(df['high'], df['low'], df['close'], df['volume'])
+        # Calculate A/D Line (unless shared)
+        ad_line = self.get_precomputed(('ad',))
+        if ad_line is None:
+            ad_line = accumulation_distribution(df['high'], df['low'], df['close'], df['volume'])
+        df['ad_line'] = ad_line
 
         # Calculate A/D MA
         if self.ma_type == 'ema':
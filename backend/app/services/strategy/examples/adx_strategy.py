@@ -21,12 +21,12 @@ Performance Notes:
 - May miss early trend entries (ADX lags)
 - Reduces trading frequency but increases win rate
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
 from ..base_strategy import Strategy
-from ..indicators import adx, atr
+from ..indicators import adx, atr, directional_indicators
 from ..strategy_types import (
     StrategyType,
     StrategyCategory,
@@ -163,26 +163,11 @@ class ADXTrendStrength(Strategy):
         Returns:
             Tuple of (+DI, -DI) Series
         """
-        high = data['high']
-        low = data['low']
-        close = data['close']
-        period = self.di_period
+        shared_di = self.get_precomputed(('di', self.di_period))
+        if shared_di is not None:
+            return shared_di
 
-        # Calculate +DM and -DM
-        high_diff = high.diff()
-        low_diff = -low.diff()
-
-        plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
-        minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
-
-        # Calculate ATR
-        atr_values = atr(high, low, close, period)
-
-        # Calculate +DI and -DI
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr_values)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr_values)
-
-        return plus_di, minus_di
+        return directional_indicators(data['high'], data['low'], data['close'], self.di_period)
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -208,8 +193,11 @@ class ADXTrendStrength(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate ADX
-        df['adx_value'] = adx(df['high'], df['low'], df['close'], self.adx_period)
+        # Calculate ADX (unless shared)
+        shared_adx = self.get_precomputed(('adx', self.adx_period))
+        df['adx_value'] = shared_adx if shared_adx is not None else adx(
+            df['high'], df['low'], df['close'], self.adx_period
+        )
 
         # Calculate Directional Indicators
         df['plus_di'], df['minus_di'] = self._calculate_directional_indicators(df)
@@ -273,6 +261,15 @@ class ADXTrendStrength(Strategy):
 
         return df
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicators this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the ADX and the directional indicators
+        """
+        return [('adx', self.adx_period), ('di', self.di_period)]
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
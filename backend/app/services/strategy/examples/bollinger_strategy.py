@@ -17,7 +17,7 @@ Performance Notes:
 - Adding trend filter helps avoid false signals during strong trends
 - Band squeeze (narrow bands) often precedes large moves
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -132,19 +132,23 @@ class BollingerBandMeanReversion(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate Bollinger Bands
-        df['bb_upper'], df['bb_middle'], df['bb_lower'] = bollinger_bands(
-            df['close'],
-            self.bb_period,
-            self.bb_std_dev
-        )
+        # Calculate Bollinger Bands (unless shared)
+        bands = self.get_precomputed(('bollinger', self.bb_period, self.bb_std_dev))
+        if bands is None:
+            bands = bollinger_bands(
+                df['close'],
+                self.bb_period,
+                self.bb_std_dev
+            )
+        df['bb_upper'], df['bb_middle'], df['bb_lower'] = bands
 
         # Calculate band width (useful for detecting squeezes)
         df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
 
         # Calculate trend filter if enabled
         if self.use_trend_filter:
-            df['trend_sma'] = sma(df['close'], self.trend_period)
+            trend_sma = self.get_precomputed(('sma', self.trend_period))
+            df['trend_sma'] = trend_sma if trend_sma is not None else sma(df['close'], self.trend_period)
 
         # Initialize signal and position columns
         df['signal'] = 0
@@ -206,6 +210,18 @@ class BollingerBandMeanReversion(Strategy):
 
         return df
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicators this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the Bollinger Bands and the optional trend SMA
+        """
+        keys = [('bollinger', self.bb_period, self.bb_std_dev)]
+        if self.use_trend_filter:
+            keys.append(('sma', self.trend_period))
+        return keys
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
@@ -23,7 +23,7 @@ Performance Notes:
 - Simple and robust across different markets and timeframes
 - Can have long drawdowns in non-trending periods
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -191,16 +191,18 @@ class DonchianBreakout(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate entry Donchian Channel
-        df['entry_upper'], df['entry_middle'], df['entry_lower'] = donchian_channel(
-            df['high'], df['low'], self.entry_period
-        )
+        # Calculate entry Donchian Channel (unless shared)
+        entry_channel = self.get_precomputed(('donchian', self.entry_period))
+        if entry_channel is None:
+            entry_channel = donchian_channel(df['high'], df['low'], self.entry_period)
+        df['entry_upper'], df['entry_middle'], df['entry_lower'] = entry_channel
 
         # Calculate exit Donchian Channel (if different period)
         if self.exit_period != self.entry_period:
-            df['exit_upper'], _, df['exit_lower'] = donchian_channel(
-                df['high'], df['low'], self.exit_period
-            )
+            exit_channel = self.get_precomputed(('donchian', self.exit_period))
+            if exit_channel is None:
+                exit_channel = donchian_channel(df['high'], df['low'], self.exit_period)
+            df['exit_upper'], _, df['exit_lower'] = exit_channel
         else:
             df['exit_upper'] = df['entry_upper']
             df['exit_lower'] = df['entry_lower']
@@ -277,6 +279,15 @@ class DonchianBreakout(Strategy):
 
         return df
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicators this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the entry and exit Donchian Channels
+        """
+        return [('donchian', self.entry_period), ('donchian', self.exit_period)]
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
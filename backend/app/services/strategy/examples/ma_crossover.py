@@ -9,12 +9,13 @@ Strategy Logic:
 
 This strategy works well in trending markets but may generate false signals in ranging markets.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
 from ..base_strategy import Strategy
 from ..indicators import sma, ema
+from ..kernels import NUMBA_AVAILABLE, moving_average_kernel, crossover_kernel
 
 
 class MovingAverageCrossover(Strategy):
@@ -111,13 +112,37 @@ class MovingAverageCrossover(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate moving averages
-        if self.ma_type == 'sma':
-            df['fast_ma'] = sma(df['close'], self.fast_period)
-            df['slow_ma'] = sma(df['close'], self.slow_period)
-        else:  # ema
-            df['fast_ma'] = ema(df['close'], self.fast_period)
-            df['slow_ma'] = ema(df['close'], self.slow_period)
+        # Moving averages shared via use_precomputed() skip recomputation
+        fast_key = (self.ma_type, self.fast_period)
+        slow_key = (self.ma_type, self.slow_period)
+        fast_ma = self.get_precomputed(fast_key)
+        slow_ma = self.get_precomputed(slow_key)
+
+        # Compiled single-pass path (requires numba and gap-free prices)
+        if NUMBA_AVAILABLE:
+            close = df['close'].to_numpy(dtype=np.float64)
+            if not np.isnan(close).any():
+                use_ema = self.ma_type == 'ema'
+                fast_values = (
+                    fast_ma.to_numpy(dtype=np.float64) if fast_ma is not None
+                    else moving_average_kernel(close, self.fast_period, use_ema)
+                )
+                slow_values = (
+                    slow_ma.to_numpy(dtype=np.float64) if slow_ma is not None
+                    else moving_average_kernel(close, self.slow_period, use_ema)
+                )
+                signal, position = crossover_kernel(fast_values, slow_values, self.slow_period)
+
+                df['fast_ma'] = fast_values
+                df['slow_ma'] = slow_values
+                df['signal'] = signal
+                df['position'] = position
+                return df
+
+        # Calculate moving averages (unless shared)
+        ma_func = sma if self.ma_type == 'sma' else ema
+        df['fast_ma'] = fast_ma if fast_ma is not None else ma_func(df['close'], self.fast_period)
+        df['slow_ma'] = slow_ma if slow_ma is not None else ma_func(df['close'], self.slow_period)
 
         # Initialize signal column
         df['signal'] = 0
@@ -152,6 +177,15 @@ class MovingAverageCrossover(Strategy):
 
         return df
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Moving averages this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the fast and slow moving averages
+        """
+        return [(self.ma_type, self.fast_period), (self.ma_type, self.slow_period)]
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
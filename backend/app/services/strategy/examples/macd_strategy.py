@@ -17,7 +17,7 @@ Performance Notes:
 - Lagging indicator - signals come after trend has started
 - Can generate whipsaws in choppy, sideways markets
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -141,17 +141,21 @@ class MACDCrossover(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate MACD
-        df['macd'], df['macd_signal'], df['macd_histogram'] = calculate_macd(
-            df['close'],
-            self.fast_period,
-            self.slow_period,
-            self.signal_period
-        )
+        # Calculate MACD (unless shared)
+        macd_values = self.get_precomputed(self._macd_key())
+        if macd_values is None:
+            macd_values = calculate_macd(
+                df['close'],
+                self.fast_period,
+                self.slow_period,
+                self.signal_period
+            )
+        df['macd'], df['macd_signal'], df['macd_histogram'] = macd_values
 
         # Calculate trend filter if enabled
         if self.use_trend_filter:
-            df['trend_sma'] = sma(df['close'], self.trend_period)
+            trend_sma = self.get_precomputed(('sma', self.trend_period))
+            df['trend_sma'] = trend_sma if trend_sma is not None else sma(df['close'], self.trend_period)
 
         # Initialize signal and position columns
         df['signal'] = 0
@@ -247,6 +251,22 @@ class MACDCrossover(Strategy):
 
         return df
 
+    def _macd_key(self) -> Tuple:
+        """Shared-cache key for this strategy's MACD parameters."""
+        return ('macd', self.fast_period, self.slow_period, self.signal_period)
+
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicators this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the MACD lines and the optional trend SMA
+        """
+        keys = [self._macd_key()]
+        if self.use_trend_filter:
+            keys.append(('sma', self.trend_period))
+        return keys
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
@@ -5,7 +5,7 @@ OBV is a momentum indicator that uses volume flow to predict changes in stock pr
 Rising OBV confirms uptrends, falling OBV confirms downtrends.
 Divergences between price and OBV can signal potential reversals.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 from app.services.strategy.base_strategy import Strategy
 from app.services.strategy.indicators import obv, sma
@@ -31,12 +31,17 @@ class OBVTrendConfirmation(Strategy):
         """Setup strategy - no special initialization needed for OBV strategies."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('obv',)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on OBV trend confirmation."""
         df = data.copy()
 
-        # Calculate OBV
-        df['obv'] = obv(df['close'], df['volume'])
+        # Calculate OBV (unless shared)
+        shared_obv = self.get_precomputed(('obv',))
+        df['obv'] = shared_obv if shared_obv is not None else obv(df['close'], df['volume'])
 
         # Calculate OBV moving average for smoothing
         df['obv_ma'] = sma(df['obv'], self.obv_ma_period)
@@ -90,12 +95,17 @@ class OBVDivergence(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('obv',)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on OBV divergences."""
         df = data.copy()
 
-        # Calculate OBV and its MA
-        df['obv'] = obv(df['close'], df['volume'])
+        # Calculate OBV (unless shared) and its MA
+        shared_obv = self.get_precomputed(('obv',))
+        df['obv'] = shared_obv if shared_obv is not None else obv(df['close'], df['volume'])
         df['obv_ma'] = sma(df['obv'], self.obv_ma_period)
 
         # Calculate rolling lows and highs
@@ -147,12 +157,17 @@ class OBVBreakout(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('obv',)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on OBV crossovers."""
         df = data.copy()
 
-        # Calculate OBV and its MA
-        df['obv'] = obv(df['close'], df['volume'])
+        # Calculate OBV (unless shared) and its MA
+        shared_obv = self.get_precomputed(('obv',))
+        df['obv'] = shared_obv if shared_obv is not None else obv(df['close'], df['volume'])
         df['obv_ma'] = sma(df['obv'], self.obv_ma_period)
 
         # Previous values for crossover detection
@@ -15,7 +15,7 @@ Performance Notes:
 - Can generate losses in strong trending markets (price stays overbought/oversold)
 - Adding trend filter improves performance but reduces trading frequency
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -172,12 +172,14 @@ class RSIOverboughtOversold(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate RSI
-        df['rsi'] = rsi(df['close'], self.rsi_period)
+        # Calculate RSI (unless shared)
+        shared_rsi = self.get_precomputed(('rsi', self.rsi_period))
+        df['rsi'] = shared_rsi if shared_rsi is not None else rsi(df['close'], self.rsi_period)
 
         # Calculate trend filter if enabled
         if self.use_trend_filter:
-            df['trend_sma'] = sma(df['close'], self.trend_period)
+            trend_sma = self.get_precomputed(('sma', self.trend_period))
+            df['trend_sma'] = trend_sma if trend_sma is not None else sma(df['close'], self.trend_period)
 
         # Initialize signal and position columns
         df['signal'] = 0
@@ -223,6 +225,18 @@ class RSIOverboughtOversold(Strategy):
 
         return df
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicators this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the RSI and the optional trend SMA
+        """
+        keys = [('rsi', self.rsi_period)]
+        if self.use_trend_filter:
+            keys.append(('sma', self.trend_period))
+        return keys
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
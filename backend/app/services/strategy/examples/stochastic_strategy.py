@@ -24,7 +24,7 @@ Performance Notes:
 - %K/%D crossover provides better entries than raw levels
 - Can stay overbought/oversold for extended periods in trends
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 import numpy as np
 
@@ -193,15 +193,20 @@ class StochasticOscillator(Strategy):
         # Make a copy to avoid modifying original data
         df = data.copy()
 
-        # Calculate Stochastic Oscillator
-        df['stoch_k'], df['stoch_d'] = stochastic(
-            df['high'], df['low'], df['close'],
-            self.k_period, self.d_period
-        )
+        # Calculate Stochastic Oscillator (unless shared)
+        shared_stoch = self.get_precomputed(('stochastic', self.k_period, self.d_period))
+        if shared_stoch is not None:
+            df['stoch_k'], df['stoch_d'] = shared_stoch
+        else:
+            df['stoch_k'], df['stoch_d'] = stochastic(
+                df['high'], df['low'], df['close'],
+                self.k_period, self.d_period
+            )
 
         # Calculate trend filter if enabled
         if self.use_trend_filter:
-            df['trend_sma'] = sma(df['close'], self.trend_period)
+            trend_sma = self.get_precomputed(('sma', self.trend_period))
+            df['trend_sma'] = trend_sma if trend_sma is not None else sma(df['close'], self.trend_period)
 
         # Initialize signal and position columns
         df['signal'] = 0
@@ -270,6 +275,18 @@ class StochasticOscillator(Strategy):
 
         return df
 
+    def required_indicators(self) -> List[Tuple]:
+        """
+        Indicators this strategy can take from a shared cache.
+
+        Returns:
+            Keys for the Stochastic Oscillator and the optional trend SMA
+        """
+        keys = [('stochastic', self.k_period, self.d_period)]
+        if self.use_trend_filter:
+            keys.append(('sma', self.trend_period))
+        return keys
+
     def get_required_history(self) -> int:
         """
         Return the minimum number of bars required for this strategy.
@@ -5,7 +5,7 @@ VWMA gives more weight to price periods with higher volume, making it more respo
 to institutional activity and significant price moves. This can provide earlier signals
 than traditional moving averages during high-volume trend changes.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import pandas as pd
 from app.services.strategy.base_strategy import Strategy
 from app.services.strategy.indicators import vwma, sma
@@ -31,13 +31,19 @@ class VWMACrossover(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('vwma', self.fast_period), ('vwma', self.slow_period)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on VWMA crossovers."""
         df = data.copy()
 
-        # Calculate VWMAs
-        df['vwma_fast'] = vwma(df['close'], df['volume'], self.fast_period)
-        df['vwma_slow'] = vwma(df['close'], df['volume'], self.slow_period)
+        # Calculate VWMAs (unless shared)
+        vwma_fast = self.get_precomputed(('vwma', self.fast_period))
+        df['vwma_fast'] = vwma_fast if vwma_fast is not None else vwma(df['close'], df['volume'], self.fast_period)
+        vwma_slow = self.get_precomputed(('vwma', self.slow_period))
+        df['vwma_slow'] = vwma_slow if vwma_slow is not None else vwma(df['close'], df['volume'], self.slow_period)
 
         # Previous values for crossover detection
         df['prev_fast'] = df['vwma_fast'].shift(1)
@@ -77,13 +83,19 @@ class VWMAvsSMA(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('vwma', self.period), ('sma', self.period)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals comparing VWMA to SMA."""
         df = data.copy()
 
-        # Calculate VWMA and SMA of same period
-        df['vwma'] = vwma(df['close'], df['volume'], self.period)
-        df['sma'] = sma(df['close'], self.period)
+        # Calculate VWMA and SMA of same period (unless shared)
+        shared_vwma = self.get_precomputed(('vwma', self.period))
+        df['vwma'] = shared_vwma if shared_vwma is not None else vwma(df['close'], df['volume'], self.period)
+        sma_values = self.get_precomputed(('sma', self.period))
+        df['sma'] = sma_values if sma_values is not None else sma(df['close'], self.period)
 
         # Previous values for crossover detection
         df['prev_vwma'] = df['vwma'].shift(1)
@@ -122,12 +134,17 @@ class VWMAPricePosition(Strategy):
         """Setup strategy - no special initialization needed."""
         pass
 
+    def required_indicators(self) -> List[Tuple]:
+        """Indicators this strategy can take from a shared cache."""
+        return [('vwma', self.vwma_period)]
+
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on price position vs VWMA."""
         df = data.copy()
 
-        # Calculate VWMA
-        df['vwma'] = vwma(df['close'], df['volume'], self.vwma_period)
+        # Calculate VWMA (unless shared)
+        shared_vwma = self.get_precomputed(('vwma', self.vwma_period))
+        df['vwma'] = shared_vwma if shared_vwma is not None else vwma(df['close'], df['volume'], self.vwma_period)
 
         # Previous values for crossover detection
         df['prev_close'] = df['close'].shift(1)
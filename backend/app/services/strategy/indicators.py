@@ -3,10 +3,16 @@ Technical Indicators Module
 
 Pure pandas implementation of common technical indicators.
 This module provides a ta-lib alternative using only pandas and numpy.
+Rolling extremes and OBV use the compiled kernels in kernels.py when
+Numba is installed.
 """
+import hashlib
+
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .kernels import NUMBA_AVAILABLE, obv_kernel, rolling_max_kernel, rolling_min_kernel
 
 
 def sma(data: pd.Series, period: int) -> pd.Series:
@@ -24,7 +30,91 @@ def sma(data: pd.Series, period: int) -> pd.Series:
     if isinstance(data, pd.DataFrame):
         data = data.iloc[:, 0] if len(data.columns) == 1 else data.squeeze()
 
-    return data.rolling(window=period, min_periods=period).mean()
+    values = data.to_numpy(dtype=np.float64)
+
+    # Rolling windows skip NaNs, which prefix-sum differencing cannot do
+    if len(values) < period or np.isnan(values).any():
+        return data.rolling(window=period, min_periods=period).mean()
+
+    # O(N) prefix-sum differencing: sum(x[i-period+1..i]) = csum[i] - csum[i-period]
+    csum = np.cumsum(values)
+    result = np.full(len(values), np.nan)
+    result[period - 1] = csum[period - 1]
+    result[period:] = csum[period:] - csum[:-period]
+    result[period - 1:] /= period
+
+    return pd.Series(result, index=data.index, name=data.name)
+
+
+def sma_multi(data: pd.Series, periods: Iterable[int]) -> Dict[int, pd.Series]:
+    """
+    Simple Moving Averages for several periods from one cumulative sum.
+
+    Args:
+        data: Price series (typically close prices)
+        periods: Periods to compute
+
+    Returns:
+        Dictionary mapping period -> Series with SMA values (same values as sma())
+    """
+    if isinstance(data, pd.DataFrame):
+        data = data.iloc[:, 0] if len(data.columns) == 1 else data.squeeze()
+
+    periods = sorted(set(int(p) for p in periods))
+    values = data.to_numpy(dtype=np.float64)
+
+    if np.isnan(values).any():
+        return {period: sma(data, period) for period in periods}
+
+    csum = np.cumsum(values)
+    results = {}
+
+    for period in periods:
+        if len(values) < period:
+            results[period] = sma(data, period)
+            continue
+
+        result = np.full(len(values), np.nan)
+        result[period - 1] = csum[period - 1]
+        result[period:] = csum[period:] - csum[:-period]
+        result[period - 1:] /= period
+        results[period] = pd.Series(result, index=data.index, name=data.name)
+
+    return results
+
+
+def rolling_max(data: pd.Series, period: int) -> pd.Series:
+    """
+    Rolling maximum over a full window (NaN until `period` bars are available).
+
+    Args:
+        data: Price series
+        period: Window length
+
+    Returns:
+        Series with rolling maximum values
+    """
+    if NUMBA_AVAILABLE and not data.hasnans:
+        values = np.ascontiguousarray(data.to_numpy(), dtype=np.float64)
+        return pd.Series(rolling_max_kernel(values, period), index=data.index, name=data.name)
+    return data.rolling(window=period, min_periods=period).max()
+
+
+def rolling_min(data: pd.Series, period: int) -> pd.Series:
+    """
+    Rolling minimum over a full window (NaN until `period` bars are available).
+
+    Args:
+        data: Price series
+        period: Window length
+
+    Returns:
+        Series with rolling minimum values
+    """
+    if NUMBA_AVAILABLE and not data.hasnans:
+        values = np.ascontiguousarray(data.to_numpy(), dtype=np.float64)
+        return pd.Series(rolling_min_kernel(values, period), index=data.index, name=data.name)
+    return data.rolling(window=period, min_periods=period).min()
 
 
 def ema(data: pd.Series, period: int) -> pd.Series:
@@ -185,8 +275,8 @@ def stochastic(
         Tuple of (%K, %D)
     """
     # Calculate %K
-    lowest_low = low.rolling(window=k_period, min_periods=k_period).min()
-    highest_high = high.rolling(window=k_period, min_periods=k_period).max()
+    lowest_low = rolling_min(low, k_period)
+    highest_high = rolling_max(high, k_period)
 
     k_values = 100 * (close - lowest_low) / (highest_high - lowest_low)
 
@@ -240,23 +330,23 @@ def vwap(
     return vwap_values
 
 
-def adx(
+def directional_indicators(
     high: pd.Series,
     low: pd.Series,
     close: pd.Series,
     period: int = 14
-) -> pd.Series:
+) -> Tuple[pd.Series, pd.Series]:
     """
-    Average Directional Index (trend strength indicator).
+    Directional Indicators (+DI and -DI), the inputs to ADX.
 
     Args:
         high: High prices
         low: Low prices
         close: Close prices
-        period: Number of periods for ADX calculation (default: 14)
+        period: Number of periods for smoothing (default: 14)
 
     Returns:
-        Series with ADX values (0-100)
+        Tuple of (+DI, -DI)
     """
     # Calculate +DM and -DM
     high_diff = high.diff()
@@ -272,6 +362,29 @@ def adx(
     plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr_values)
     minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr_values)
 
+    return plus_di, minus_di
+
+
+def adx(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    period: int = 14
+) -> pd.Series:
+    """
+    Average Directional Index (trend strength indicator).
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: Number of periods for ADX calculation (default: 14)
+
+    Returns:
+        Series with ADX values (0-100)
+    """
+    plus_di, minus_di = directional_indicators(high, low, close, period)
+
     # Calculate DX and ADX
     dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di)
     adx_values = dx.rolling(window=period).mean()
@@ -326,8 +439,8 @@ def donchian_channel(
     Returns:
         Tuple of (upper_channel, middle_channel, lower_channel)
     """
-    upper_channel = high.rolling(window=period, min_periods=period).max()
-    lower_channel = low.rolling(window=period, min_periods=period).min()
+    upper_channel = rolling_max(high, period)
+    lower_channel = rolling_min(low, period)
     middle_channel = (upper_channel + lower_channel) / 2
 
     return upper_channel, middle_channel, lower_channel
@@ -352,6 +465,13 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     Returns:
         Series with OBV values
     """
+    if NUMBA_AVAILABLE and not (close.hasnans or volume.hasnans):
+        obv_values = obv_kernel(
+            np.ascontiguousarray(close.to_numpy(), dtype=np.float64),
+            np.ascontiguousarray(volume.to_numpy(), dtype=np.float64)
+        )
+        return pd.Series(obv_values, index=close.index)
+
     # Calculate price direction
     price_change = close.diff()
 
@@ -434,3 +554,110 @@ def vwma(close: pd.Series, volume: pd.Series, period: int) -> pd.Series:
     vwma_values = pv_sum / volume_sum
 
     return vwma_values
+
+
+# Close-price indicators that precompute() can share, keyed by the first
+# element of the cache key; the remaining elements are the arguments
+_PRECOMPUTABLE = {
+    'ema': ema,
+    'rsi': rsi,
+    'macd': macd,
+    'bollinger': bollinger_bands,
+}
+
+# Indicators that need more than the close column: each takes the OHLCV
+# DataFrame followed by the remaining elements of the cache key
+_PRECOMPUTABLE_OHLCV = {
+    'adx': lambda df, period: adx(df['high'], df['low'], df['close'], period),
+    'di': lambda df, period: directional_indicators(df['high'], df['low'], df['close'], period),
+    'stochastic': lambda df, k_period, d_period: stochastic(
+        df['high'], df['low'], df['close'], k_period, d_period
+    ),
+    'donchian': lambda df, period: donchian_channel(df['high'], df['low'], period),
+    'obv': lambda df: obv(df['close'], df['volume']),
+    'ad': lambda df: accumulation_distribution(df['high'], df['low'], df['close'], df['volume']),
+    'vwma': lambda df, period: vwma(df['close'], df['volume'], period),
+}
+
+
+# Columns an indicator cache is tied to (see IndicatorCache.matches)
+_SOURCE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _fingerprint(data: pd.DataFrame) -> bytes:
+    """Digest of the index and OHLCV values of `data`."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, values in [('index', data.index)] + [
+        (col, data[col]) for col in _SOURCE_COLUMNS if col in data.columns
+    ]:
+        if isinstance(values, pd.DatetimeIndex):
+            array = values.asi8
+        else:
+            array = values.to_numpy()
+        if array.dtype == object:
+            # Object arrays hold pointers; hash their values instead
+            array = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        digest.update(name.encode())
+        digest.update(array.dtype.str.encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.digest()
+
+
+class IndicatorCache(dict):
+    """
+    Indicator cache built by precompute().
+
+    A dict of indicator key -> Series that also remembers a fingerprint of
+    the bars it was computed from, so strategies never reuse it on other
+    data that merely shares the same dates. Only the fingerprint is kept,
+    which keeps the cache cheap to send to worker processes.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        super().__init__()
+        self.fingerprint = _fingerprint(data)
+
+    def matches(self, data: pd.DataFrame) -> bool:
+        """True if `data` has the same index and OHLCV values as the source bars."""
+        return _fingerprint(data) == self.fingerprint
+
+
+def precompute(data: pd.DataFrame, keys: Iterable[Tuple]) -> IndicatorCache:
+    """
+    Compute a shared indicator cache for several strategies in one pass.
+
+    Keys are tuples of (indicator, *args), e.g. ('sma', 20), ('ema', 12),
+    ('rsi', 14), ('macd', 12, 26, 9) or ('bollinger', 20, 2.0) on the close
+    column, and ('adx', 14), ('di', 14), ('stochastic', 14, 3),
+    ('donchian', 20), ('obv',), ('ad',) or ('vwma', 20) on the OHLCV data.
+    All SMA periods share a single cumulative sum. Unknown keys are skipped,
+    so strategies simply compute them themselves.
+
+    Args:
+        data: OHLCV DataFrame
+        keys: Indicator keys, usually gathered from Strategy.required_indicators()
+
+    Returns:
+        IndicatorCache mapping indicator key -> Series (or tuple of Series
+        for multi-output indicators such as MACD, Stochastic and Donchian)
+    """
+    keys = set(keys)
+    close = data['close']
+    cache = IndicatorCache(data)
+
+    sma_periods: List[int] = [key[1] for key in keys if key[0] == 'sma']
+    if sma_periods:
+        for period, series in sma_multi(close, sma_periods).items():
+            cache[('sma', period)] = series
+
+    for key in keys:
+        func = _PRECOMPUTABLE.get(key[0])
+        if func is not None:
+            cache[key] = func(close, *key[1:])
+            continue
+
+        func = _PRECOMPUTABLE_OHLCV.get(key[0])
+        if func is not None:
+            cache[key] = func(data, *key[1:])
+
+    return cache
@@ -0,0 +1,268 @@
+"""
+Compiled Strategy Kernels
+
+Single-pass NumPy loops for the hottest indicator/signal paths, compiled with
+Numba when it is installed. Numba is optional: when it is missing,
+NUMBA_AVAILABLE is False and callers should keep using their pandas
+implementation (a plain-Python loop would be slower than pandas).
+
+Kernels are declared with explicit signatures (see _signatures()), so they
+are compiled, or loaded from the on-disk cache, when this module is
+imported, and calls never compile a new specialization. Array arguments
+take float64 arrays of any layout, writable or read-only (views over shared
+memory, pandas Copy-on-Write buffers); other dtypes raise TypeError.
+"""
+from itertools import product
+
+import numpy as np
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+def _signatures(*args):
+    """
+    Explicit Numba signatures for a kernel, one per array variant.
+
+    Args are 'array' (float64 input), 'out' (writable, contiguous float64
+    output), 'int' (int64) or 'bool'. Each 'array' argument has two
+    variants: writable contiguous, the common case, and read-only with any
+    layout, which every other float64 array converts to. Every combination
+    gets its own signature; return types are inferred. Empty without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return []
+
+    choices = {
+        'array': (
+            types.Array(types.float64, 1, 'C'),
+            types.Array(types.float64, 1, 'A', readonly=True)
+        ),
+        'out': (types.Array(types.float64, 1, 'C'),),
+        'int': (types.int64,),
+        'bool': (types.boolean,),
+    }
+    return list(product(*(choices[arg] for arg in args)))
+
+
+@njit(_signatures('array', 'int', 'bool', 'out'), cache=True)
+def _moving_average_into(close, period, use_ema, out):
+    """
+    Fill `out` with an SMA or EMA of `close`.
+
+    Matches pandas rolling(period, min_periods=period).mean() and
+    ewm(span=period, adjust=False, min_periods=period).mean():
+    the first period-1 values are left as NaN.
+    """
+    n = close.shape[0]
+
+    if use_ema:
+        alpha = 2.0 / (period + 1.0)
+        value = close[0]
+        for i in range(n):
+            if i > 0:
+                value = (1.0 - alpha) * value + alpha * close[i]
+            if i >= period - 1:
+                out[i] = value
+    else:
+        running_sum = 0.0
+        for i in range(n):
+            running_sum += close[i]
+            if i >= period:
+                running_sum -= close[i - period]
+            if i >= period - 1:
+                out[i] = running_sum / period
+
+
+@njit(_signatures('array', 'int', 'bool'), cache=True)
+def moving_average_kernel(close, period, use_ema):
+    """
+    SMA or EMA of `close` as a new array (NaN for the first period-1 bars).
+
+    Args:
+        close: float64 array of close prices (no NaNs)
+        period: Moving average period
+        use_ema: True for EMA, False for SMA
+
+    Returns:
+        float64 array of moving average values
+    """
+    out = np.full(close.shape[0], np.nan)
+    _moving_average_into(close, period, use_ema, out)
+    return out
+
+
+@njit(_signatures('array', 'array', 'int'), cache=True)
+def crossover_kernel(fast_ma, slow_ma, slow_period):
+    """
+    Crossover signals and long/flat positions from two moving averages.
+
+    Args:
+        fast_ma: float64 array of the fast moving average
+        slow_ma: float64 array of the slow moving average
+        slow_period: Slow period; positions are tracked from this bar on
+
+    Returns:
+        Tuple of (signal, position) int64 arrays
+    """
+    n = fast_ma.shape[0]
+    signal = np.zeros(n, dtype=np.int64)
+    position = np.zeros(n, dtype=np.int64)
+    current_position = 0
+
+    for i in range(n):
+        # Crossovers need both averages valid on this and the previous bar
+        if i > 0:
+            prev_fast = fast_ma[i - 1]
+            prev_slow = slow_ma[i - 1]
+            fast = fast_ma[i]
+            slow = slow_ma[i]
+
+            if not (np.isnan(prev_fast) or np.isnan(prev_slow) or np.isnan(fast) or np.isnan(slow)):
+                if prev_fast <= prev_slow and fast > slow:
+                    signal[i] = 1
+                elif prev_fast >= prev_slow and fast < slow:
+                    signal[i] = -1
+
+        # Positions are only tracked once the slow average has warmed up
+        if i >= slow_period:
+            if signal[i] == 1:
+                current_position = 1
+            elif signal[i] == -1:
+                current_position = 0
+        position[i] = current_position
+
+    return signal, position
+
+
+@njit(_signatures('array', 'int', 'bool'), cache=True)
+def _rolling_extreme(values, window, use_max):
+    """
+    Rolling max (or min) over `window` bars using a monotonic index deque.
+
+    O(n) regardless of the window size. Matches pandas
+    rolling(window, min_periods=window).max()/.min() on NaN-free input:
+    the first window-1 values are NaN.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+
+    for i in range(n):
+        value = values[i]
+
+        # Drop candidates the new value dominates
+        if use_max:
+            while tail > head and values[deque[tail - 1]] <= value:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= value:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+
+        # Drop the front once it leaves the window
+        if deque[head] <= i - window:
+            head += 1
+
+        if i >= window - 1:
+            out[i] = values[deque[head]]
+
+    return out
+
+
+@njit(_signatures('array', 'int'), cache=True)
+def rolling_max_kernel(values, window):
+    """
+    Rolling maximum of a NaN-free float64 array.
+
+    Args:
+        values: float64 array (no NaNs)
+        window: Window length in bars
+
+    Returns:
+        float64 array, NaN for the first window-1 bars
+    """
+    return _rolling_extreme(values, window, True)
+
+
+@njit(_signatures('array', 'int'), cache=True)
+def rolling_min_kernel(values, window):
+    """
+    Rolling minimum of a NaN-free float64 array.
+
+    Args:
+        values: float64 array (no NaNs)
+        window: Window length in bars
+
+    Returns:
+        float64 array, NaN for the first window-1 bars
+    """
+    return _rolling_extreme(values, window, False)
+
+
+@njit(_signatures('array', 'array'), cache=True)
+def obv_kernel(close, volume):
+    """
+    On-Balance Volume in one pass.
+
+    Volume is added on up bars, subtracted on down bars and ignored on
+    unchanged bars. The first bar has no prior close and is NaN.
+
+    Args:
+        close: float64 array of close prices (no NaNs)
+        volume: float64 array of volume
+
+    Returns:
+        float64 array of OBV values
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    out[0] = np.nan
+    total = 0.0
+    for i in range(1, n):
+        if close[i] > close[i - 1]:
+            total += volume[i]
+        elif close[i] < close[i - 1]:
+            total -= volume[i]
+        out[i] = total
+
+    return out
+
+
+def warmup():
+    """
+    Run every kernel once on tiny inputs.
+
+    The kernels are compiled (or loaded from the on-disk cache) on import;
+    this also runs them, so a broken kernel fails before a worker pool
+    starts rather than inside every worker. No-op when Numba is not
+    installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    close = np.linspace(1.0, 2.0, 8)
+    fast = moving_average_kernel(close, 2, False)
+    slow = moving_average_kernel(close, 3, True)
+    crossover_kernel(fast, slow, 3)
+    rolling_max_kernel(close, 3)
+    rolling_min_kernel(close, 3)
+    obv_kernel(close, close)
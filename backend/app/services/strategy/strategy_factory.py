@@ -5,11 +5,29 @@ Provides a factory pattern for creating strategy instances from configurations.
 Makes it easy to instantiate strategies without knowing their specific classes.
 """
 from __future__ import annotations
-from typing import Dict, Any, Type, Optional, List
+from typing import Dict, Any, Type, Optional, List, Set, NamedTuple, Tuple
 from .base_strategy import Strategy
 from .strategy_types import StrategyType, StrategyMetadata
 
 
+class StrategyInfo(NamedTuple):
+    """
+    Read-only summary of a registered strategy, as returned by list_info().
+
+    Metadata fields are None (tags empty) for strategies registered without
+    metadata.
+    """
+    name: str
+    class_name: str
+    module: str
+    type: Optional[str] = None
+    category: Optional[str] = None
+    complexity: Optional[str] = None
+    description: Optional[str] = None
+    suitable_for_beginners: Optional[bool] = None
+    tags: Tuple[str, ...] = ()
+
+
 class StrategyFactory:
     """
     Factory for creating strategy instances.
@@ -35,6 +53,22 @@ class StrategyFactory:
         self._metadata: Dict[str, StrategyMetadata] = {}
         self._type_index: Dict[StrategyType, list] = {}
 
+        # Inverted indices for search(): metadata value -> strategy names
+        self._category_index: Dict[str, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._beginner_index: Dict[bool, Set[str]] = {}
+
+        # Index entries made for each name, so removal undoes exactly those
+        # even if the (mutable) metadata object changed since registration
+        self._indexed: Dict[str, Tuple[StrategyType, str, Tuple[str, ...], bool]] = {}
+
+        # Registration order, so search() results keep a stable order
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+        # list_info() result, rebuilt after the registry changes
+        self._info: Optional[List[StrategyInfo]] = None
+
     def register(
         self,
         name: str,
@@ -59,29 +93,61 @@ class StrategyFactory:
             raise TypeError(f"Strategy class must inherit from Strategy base class")
 
         self._strategies[name] = strategy_class
+        self._order[name] = self._next_order
+        self._next_order += 1
+        self._info = None
+
+        # Never leave metadata or index entries from an earlier registration
+        # of this name
+        self._unindex(name)
+        self._metadata.pop(name, None)
 
         if metadata:
             self._metadata[name] = metadata
-
-            # Index by type for faster lookup
-            strategy_type = metadata.strategy_type
-            if strategy_type not in self._type_index:
-                self._type_index[strategy_type] = []
-            self._type_index[strategy_type].append(name)
+            self._index(name, metadata)
+
+    def _index(self, name: str, metadata: StrategyMetadata) -> None:
+        """Add a strategy to the type and search indices."""
+        entry = (
+            metadata.strategy_type,
+            metadata.category.value,
+            tuple(dict.fromkeys(metadata.tags)),
+            metadata.suitable_for_beginners
+        )
+        strategy_type, category, tags, beginner = entry
+        self._indexed[name] = entry
+
+        # Index by type for faster lookup
+        self._type_index.setdefault(strategy_type, []).append(name)
+
+        # Index the searchable fields
+        self._category_index.setdefault(category, set()).add(name)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(name)
+        self._beginner_index.setdefault(beginner, set()).add(name)
+
+    def _unindex(self, name: str) -> None:
+        """Remove the index entries recorded for a strategy, if any."""
+        entry = self._indexed.pop(name, None)
+        if entry is None:
+            return
+
+        strategy_type, category, tags, beginner = entry
+        self._type_index[strategy_type].remove(name)
+        self._category_index[category].discard(name)
+        for tag in tags:
+            self._tag_index[tag].discard(name)
+        self._beginner_index[beginner].discard(name)
 
     def unregister(self, name: str) -> None:
         """Remove a strategy from the registry."""
         if name in self._strategies:
             del self._strategies[name]
+            del self._order[name]
+            self._info = None
 
-            if name in self._metadata:
-                metadata = self._metadata[name]
-                strategy_type = metadata.strategy_type
-
-                if strategy_type in self._type_index:
-                    self._type_index[strategy_type].remove(name)
-
-                del self._metadata[name]
+            self._unindex(name)
+            self._metadata.pop(name, None)
 
     def create(self, name: str, config: Dict[str, Any]) -> Strategy:
         """
@@ -177,6 +243,39 @@ class StrategyFactory:
 
         return result
 
+    def list_info(self) -> List[StrategyInfo]:
+        """
+        List all registered strategies as StrategyInfo tuples.
+
+        Same information as list_all(), but built once and reused until a
+        strategy is registered or removed.
+
+        Returns:
+            List of StrategyInfo, in registration order
+        """
+        if self._info is None:
+            self._info = []
+
+            for name, strategy_class in self._strategies.items():
+                metadata = self._metadata.get(name)
+                if metadata is None:
+                    info = StrategyInfo(name, strategy_class.__name__, strategy_class.__module__)
+                else:
+                    info = StrategyInfo(
+                        name=name,
+                        class_name=strategy_class.__name__,
+                        module=strategy_class.__module__,
+                        type=metadata.strategy_type.value,
+                        category=metadata.category.value,
+                        complexity=metadata.complexity,
+                        description=metadata.description,
+                        suitable_for_beginners=metadata.suitable_for_beginners,
+                        tags=tuple(metadata.tags)
+                    )
+                self._info.append(info)
+
+        return list(self._info)
+
     def list_by_type(self, strategy_type: StrategyType) -> List[str]:
         """
         Get all strategy names of a specific type.
@@ -199,6 +298,9 @@ class StrategyFactory:
         """
         Search for strategies matching criteria.
 
+        Each criterion is a lookup in an index built at registration time;
+        the results are intersected rather than scanning every strategy.
+
         Args:
             strategy_type: Filter by strategy type
             category: Filter by category
@@ -206,38 +308,42 @@ class StrategyFactory:
             beginner_friendly: Filter by beginner suitability
 
         Returns:
-            List of matching strategy names
+            List of matching strategy names, in registration order
         """
-        matches = []
+        filters = []
+
+        if strategy_type:
+            filters.append(set(self._type_index.get(strategy_type, ())))
 
-        for name, metadata in self._metadata.items():
-            # Check type
-            if strategy_type and metadata.strategy_type != strategy_type:
-                continue
+        if category:
+            filters.append(self._category_index.get(category, set()))
 
-            # Check category
-            if category and metadata.category.value != category:
-                continue
+        if tags:
+            filters.append(set().union(*(self._tag_index.get(tag, ()) for tag in tags)))
 
-            # Check tags
-            if tags:
-                if not any(tag in metadata.tags for tag in tags):
-                    continue
+        if beginner_friendly is not None:
+            filters.append(self._beginner_index.get(beginner_friendly, set()))
 
-            # Check beginner friendly
-            if beginner_friendly is not None:
-                if metadata.suitable_for_beginners != beginner_friendly:
-                    continue
+        if not filters:
+            return list(self._metadata)
 
-            matches.append(name)
+        # Intersect starting from the smallest candidate set
+        filters.sort(key=len)
+        matches = filters[0].intersection(*filters[1:])
 
-        return matches
+        return sorted(matches, key=self._order.__getitem__)
 
     def clear(self) -> None:
         """Clear all registered strategies."""
         self._strategies.clear()
         self._metadata.clear()
         self._type_index.clear()
+        self._category_index.clear()
+        self._tag_index.clear()
+        self._beginner_index.clear()
+        self._indexed.clear()
+        self._order.clear()
+        self._info = None
 
 
 # Global factory instance
@@ -272,6 +378,6 @@ def create_strategy(name: str, config: Dict[str, Any]) -> Strategy:
     return _global_factory.create(name, config)
 
 
-def list_strategies() -> List[Dict[str, Any]]:
-    """List all strategies in the global factory."""
-    return _global_factory.list_all()
+def list_strategies() -> List[StrategyInfo]:
+    """List all strategies in the global factory (see StrategyFactory.list_info)."""
+    return _global_factory.list_info()
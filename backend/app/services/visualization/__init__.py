@@ -7,8 +7,10 @@ Main components:
 - StrategyVisualizer: Create interactive charts for strategies
 - calculate_metrics: Compute performance metrics
 - Chart themes and styling options
+
+StrategyVisualizer is imported lazily so that metric-only callers (such as
+the backtesting engine) do not pay for importing plotly.
 """
-from .strategy_charts import StrategyVisualizer
 from .performance_metrics import calculate_metrics, PerformanceMetrics
 
 __all__ = [
@@ -16,3 +18,11 @@ __all__ = [
     'calculate_metrics',
     'PerformanceMetrics'
 ]
+
+
+def __getattr__(name):
+    """Import chart components on first access."""
+    if name == 'StrategyVisualizer':
+        from .strategy_charts import StrategyVisualizer
+        return StrategyVisualizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
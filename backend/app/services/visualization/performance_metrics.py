@@ -125,15 +125,16 @@ def calculate_metrics(
     # Trade statistics
     trades = _extract_trades(portfolio_history)
 
-    total_trades = len(trades)
-    winning_trades = len([t for t in trades if t['profit'] > 0])
-    losing_trades = len([t for t in trades if t['profit'] < 0])
+    # Profit/Loss statistics (split once, counts derived from the splits)
+    profits = [t['profit'] for t in trades]
+    wins = [p for p in profits if p > 0]
+    losses = [p for p in profits if p < 0]
 
-    win_rate = winning_trades / total_trades if total_trades > 0 else 0
+    total_trades = len(profits)
+    winning_trades = len(wins)
+    losing_trades = len(losses)
 
-    # Profit/Loss statistics
-    wins = [t['profit'] for t in trades if t['profit'] > 0]
-    losses = [t['profit'] for t in trades if t['profit'] < 0]
+    win_rate = winning_trades / total_trades if total_trades > 0 else 0
 
     average_win = np.mean(wins) if wins else 0
     average_loss = np.mean(losses) if losses else 0
@@ -146,7 +147,7 @@ def calculate_metrics(
     profit_factor = total_wins / total_losses if total_losses > 0 else float('inf')
 
     # Average trade
-    average_trade = np.mean([t['profit'] for t in trades]) if trades else 0
+    average_trade = np.mean(profits) if profits else 0
 
     # Risk-adjusted metrics
     sharpe_ratio = _calculate_sharpe_ratio(returns, risk_free_rate)
@@ -209,7 +210,9 @@ def _simulate_portfolio(
 
     Returns DataFrame with portfolio_value, position, cash, shares columns.
     """
-    df = signals_df.copy()
+    # Shallow copy: only whole columns are (re)assigned below, which never
+    # writes into the caller's arrays, so the price data needn't be duplicated
+    df = signals_df.copy(deep=False)
 
     # Initialize portfolio state
     cash = initial_capital
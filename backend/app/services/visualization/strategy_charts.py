@@ -13,6 +13,9 @@ from pathlib import Path
 import subprocess
 import platform
 import os
+import hashlib
+import shutil
+from functools import lru_cache
 
 from .chart_themes import (
     get_theme,
@@ -26,8 +29,14 @@ from .chart_themes import (
 from .performance_metrics import PerformanceMetrics, calculate_metrics
 
 
+# Rendered dashboard charts kept per output directory (oldest evicted first)
+CHART_CACHE_MAX_ENTRIES = 32
+DASHBOARD_CHART_NAMES = ('price.html', 'equity.html', 'metrics.html')
+
+
+@lru_cache(maxsize=1)
 def is_wsl() -> bool:
-    """Check if running in WSL (Windows Subsystem for Linux)."""
+    """Check if running in WSL (Windows Subsystem for Linux); read once per process."""
     try:
         with open('/proc/version', 'r') as f:
             return 'microsoft' in f.read().lower()
@@ -185,14 +194,21 @@ class StrategyVisualizer:
                 row=1, col=1
             )
 
+        # Locate buy and sell signals in a single pass over the signal column
+        signal_values = signals['signal'].to_numpy()
+        signal_positions = np.flatnonzero(signal_values)
+        signal_sides = signal_values[signal_positions]
+        buy_positions = signal_positions[signal_sides == 1]
+        sell_positions = signal_positions[signal_sides == -1]
+        signal_close = signals['close'].to_numpy()
+
         # Add buy signals
-        buy_signals = signals[signals['signal'] == 1]
-        if len(buy_signals) > 0:
+        if len(buy_positions) > 0:
             buy_marker = get_signal_marker_style('buy')
             fig.add_trace(
                 go.Scatter(
-                    x=buy_signals.index,
-                    y=buy_signals['close'],
+                    x=signals.index[buy_positions],
+                    y=signal_close[buy_positions],
                     mode='markers',
                     name='Buy Signal',
                     marker=buy_marker,
@@ -202,13 +218,12 @@ class StrategyVisualizer:
             )
 
         # Add sell signals
-        sell_signals = signals[signals['signal'] == -1]
-        if len(sell_signals) > 0:
+        if len(sell_positions) > 0:
             sell_marker = get_signal_marker_style('sell')
             fig.add_trace(
                 go.Scatter(
-                    x=sell_signals.index,
-                    y=sell_signals['close'],
+                    x=signals.index[sell_positions],
+                    y=signal_close[sell_positions],
                     mode='markers',
                     name='Sell Signal',
                     marker=sell_marker,
@@ -493,13 +508,14 @@ class StrategyVisualizer:
             metrics_to_compare = ['total_return_pct', 'sharpe_ratio', 'max_drawdown_pct', 'win_rate_pct']
             x_labels = [s['name'] for s in strategies]
 
+            # Convert each strategy's metrics once, not once per compared metric
+            metrics_dicts = [
+                s['metrics'].to_dict() if isinstance(s['metrics'], PerformanceMetrics) else s['metrics']
+                for s in strategies
+            ]
+
             for metric_key in metrics_to_compare:
-                values = []
-                for strategy in strategies:
-                    metrics = strategy['metrics']
-                    if isinstance(metrics, PerformanceMetrics):
-                        metrics = metrics.to_dict()
-                    values.append(metrics.get(metric_key, 0))
+                values = [metrics.get(metric_key, 0) for metrics in metrics_dicts]
 
                 fig.add_trace(
                     go.Bar(
@@ -535,7 +551,8 @@ class StrategyVisualizer:
         metrics: Union[PerformanceMetrics, Dict[str, Any]],
         strategy_name: str = "Strategy",
         output_path: Optional[str] = None,
-        auto_open: bool = True
+        auto_open: bool = True,
+        use_cache: bool = False
     ) -> str:
         """
         Create a complete dashboard with all charts combined.
@@ -547,27 +564,37 @@ class StrategyVisualizer:
             strategy_name: Name for dashboard
             output_path: Path to save HTML file (optional)
             auto_open: Whether to open in browser automatically
+            use_cache: Reuse previously rendered charts for identical inputs
+                (keyed by a content hash, stored next to output_path)
 
         Returns:
             HTML string or path to saved file
         """
-        # Create individual charts
-        price_fig = self.plot_price_and_signals(data, signals, strategy_name)
-        equity_fig = self.plot_equity_curve(signals, strategy_name=strategy_name)
-        metrics_fig = self.plot_performance_metrics(metrics, strategy_name)
-
-        # Combine into single HTML with tabs (simplified version)
-        # For now, we'll create separate charts and save them
-
         if output_path:
-            # Save price chart
             price_path = output_path.replace('.html', '_price.html')
             equity_path = output_path.replace('.html', '_equity.html')
             metrics_path = output_path.replace('.html', '_metrics.html')
+            chart_paths = [price_path, equity_path, metrics_path]
+
+            cache_dir = None
+            if use_cache:
+                cache_key = self._dashboard_cache_key(data, signals, metrics, strategy_name)
+                cache_dir = Path(output_path).parent / 'cache' / cache_key
+
+            restored = cache_dir is not None and self._restore_cached_charts(cache_dir, chart_paths)
 
-            price_fig.write_html(price_path)
-            equity_fig.write_html(equity_path)
-            metrics_fig.write_html(metrics_path)
+            if not restored:
+                # Create individual charts
+                price_fig = self.plot_price_and_signals(data, signals, strategy_name)
+                equity_fig = self.plot_equity_curve(signals, strategy_name=strategy_name)
+                metrics_fig = self.plot_performance_metrics(metrics, strategy_name)
+
+                price_fig.write_html(price_path)
+                equity_fig.write_html(equity_path)
+                metrics_fig.write_html(metrics_path)
+
+                if cache_dir is not None:
+                    self._store_cached_charts(cache_dir, chart_paths)
 
             # Create main dashboard HTML
             dashboard_html = self._create_dashboard_html(
@@ -578,8 +605,7 @@ class StrategyVisualizer:
                 metrics
             )
 
-            with open(output_path, 'w') as f:
-                f.write(dashboard_html)
+            Path(output_path).write_text(dashboard_html, encoding='utf-8')
 
             if auto_open:
                 open_in_browser(output_path)
@@ -632,6 +658,72 @@ class StrategyVisualizer:
         drawdown = (portfolio_values - running_max) / running_max
         return drawdown
 
+    def _dashboard_cache_key(
+        self,
+        data: pd.DataFrame,
+        signals: pd.DataFrame,
+        metrics: Union[PerformanceMetrics, Dict[str, Any]],
+        strategy_name: str
+    ) -> str:
+        """Hash everything the dashboard charts are rendered from."""
+        if isinstance(metrics, PerformanceMetrics):
+            metrics_dict = metrics.to_dict()
+        else:
+            metrics_dict = metrics
+
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        digest.update(pd.util.hash_pandas_object(signals, index=True).to_numpy().tobytes())
+        digest.update(repr(sorted(metrics_dict.items())).encode('utf-8'))
+        digest.update(f"{strategy_name}|{self.theme}|{self.chart_size}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _restore_cached_charts(self, cache_dir: Path, chart_paths: List[str]) -> bool:
+        """
+        Copy cached chart files into place.
+
+        Returns False on a cache miss or if the entry cannot be read, in
+        which case the caller renders the charts again.
+        """
+        cached_files = [cache_dir / name for name in DASHBOARD_CHART_NAMES]
+        if not all(cached.exists() for cached in cached_files):
+            return False
+
+        try:
+            for cached, path in zip(cached_files, chart_paths):
+                shutil.copyfile(cached, path)
+
+            # Touch the entry so eviction drops the least recently used ones
+            os.utime(cache_dir)
+        except OSError:
+            return False
+
+        return True
+
+    def _store_cached_charts(self, cache_dir: Path, chart_paths: List[str]) -> None:
+        """Save rendered chart files and evict the oldest cache entries."""
+        # Fill a temporary directory and rename it into place, so an
+        # interrupted store never leaves a half-written entry behind
+        staging_dir = cache_dir.with_name(cache_dir.name + '.tmp')
+        try:
+            staging_dir.mkdir(parents=True, exist_ok=True)
+            for path, name in zip(chart_paths, DASHBOARD_CHART_NAMES):
+                shutil.copyfile(path, staging_dir / name)
+
+            # Replace any incomplete entry that caused this cache miss
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            os.replace(staging_dir, cache_dir)
+
+            entries = sorted(
+                (entry for entry in cache_dir.parent.iterdir() if entry.is_dir()),
+                key=lambda entry: entry.stat().st_mtime
+            )
+            for stale in entries[:-CHART_CACHE_MAX_ENTRIES]:
+                shutil.rmtree(stale, ignore_errors=True)
+        except OSError:
+            # Caching is best-effort; the dashboard itself is already written
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
     def _create_dashboard_html(
         self,
         strategy_name: str,
@@ -650,6 +742,7 @@ class StrategyVisualizer:
 <!DOCTYPE html>
 <html>
 <head>
+    <meta charset="utf-8">
     <title>{strategy_name} Dashboard</title>
     <style>
         body {{
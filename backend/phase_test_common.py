@@ -0,0 +1,70 @@
+"""
+Helpers shared by the phase test scripts (test_phase2_strategies.py and
+test_phase3_strategies.py).
+
+Both scripts backtest many strategy variants in a process pool with the same
+engine settings, collect failures as error records and write their results
+as JSON lines.
+"""
+import sys
+import traceback
+
+from app.services.backtesting.engine import BacktestEngine
+
+# Machine-readable results: orjson when installed, stdlib json otherwise
+try:
+    import orjson
+
+    def _dumps(record):
+        return orjson.dumps(record)
+except ImportError:
+    import json
+
+    def _dumps(record):
+        return json.dumps(record).encode('utf-8')
+
+
+def create_engine():
+    """
+    Backtest engine used for every test run: $100,000 capital, 0.1%
+    commission and 0.05% slippage.
+
+    The engine keeps no state between backtests, so one instance is built
+    per script and sent to each pool worker once.
+    """
+    return BacktestEngine(
+        initial_capital=100000,
+        commission=0.001,  # 0.1%
+        slippage=0.0005    # 0.05%
+    )
+
+
+def error_record(name, exc):
+    """
+    Structured record of a failed test, built in the worker's except block.
+
+    Workers return it instead of raising, so one failing strategy is
+    reported without aborting the rest of the pool.
+    """
+    return {'name': name, 'error': repr(exc), 'tb': traceback.format_exc()}
+
+
+def print_errors(errors, mark='✗'):
+    """One-line summary per failed test on stdout, tracebacks on stderr."""
+    for error in errors:
+        print(f"{mark} {error['name']} failed: {error['error']}")
+        sys.stderr.write(error['tb'])
+
+
+def write_results_jsonl(results, path):
+    """
+    Write one JSON object per result row (for CI and other tooling).
+
+    Args:
+        results: Structured array of results
+        path: Output file; overwritten on every run
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    names = results.dtype.names
+    with open(path, 'wb') as f:
+        f.writelines(_dumps(dict(zip(names, row))) + b'\n' for row in results.tolist())
@@ -10,6 +10,8 @@ This script runs backtests on each strategy and reports key metrics.
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add backend to path
 backend_path = Path(__file__).parent
 sys.path.insert(0, str(backend_path))
@@ -21,68 +23,74 @@ from app.services.backtesting.engine import BacktestEngine
 from app.services.data import fetch_stock_data
 from datetime import datetime, timedelta
 
-
-def test_strategy(strategy, strategy_name, symbol='AAPL', period='1y'):
-    """Test a single strategy and print results."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {strategy_name}")
-    print(f"Symbol: {symbol} | Period: {period}")
-    print(f"{'='*60}")
+# Console separators, built once
+_BANNER = '=' * 60
+_RULE = '-' * 60
+
+# Results block, filled from PerformanceMetrics.to_dict()
+_RESULTS_FMT = f"""
+{_RULE}
+BACKTEST RESULTS
+{_RULE}
+Initial Capital:     ${{initial_portfolio_value:,.2f}}
+Final Value:         ${{final_portfolio_value:,.2f}}
+Total Return:        {{total_return_pct:.2f}}%
+CAGR:                {{cagr_pct:.2f}}%
+Sharpe Ratio:        {{sharpe_ratio:.2f}}
+Max Drawdown:        {{max_drawdown_pct:.2f}}%
+
+Total Trades:        {{total_trades}}
+Winning Trades:      {{winning_trades}}
+Losing Trades:       {{losing_trades}}
+Win Rate:            {{win_rate_pct:.1f}}%
+Profit Factor:       {{profit_factor:.2f}}
+Avg Win:             ${{average_win:,.2f}}
+Avg Loss:            ${{average_loss:,.2f}}"""
+
+
+def fetch_test_data(symbol='AAPL', period='1y'):
+    """Fetch the market data shared by every strategy test for a symbol."""
+    print(f"\nFetching {period} of market data for {symbol}...")
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=365)  # 1 year
 
     try:
-        # Fetch data
-        print("Fetching market data...")
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)  # 1 year
-
         data = fetch_stock_data(
             symbol=symbol,
             start_date=start_date.strftime('%Y-%m-%d'),
             end_date=end_date.strftime('%Y-%m-%d')
         )
+    except Exception as e:
+        print(f"❌ Failed to fetch data for {symbol}: {e}")
+        return None
+
+    if data is None or len(data) == 0:
+        print(f"❌ Failed to fetch data for {symbol}")
+        return None
+
+    print(f"✓ Fetched {len(data)} bars")
+    return data
 
-        if data is None or len(data) == 0:
-            print(f"❌ Failed to fetch data for {symbol}")
-            return False
 
-        print(f"✓ Fetched {len(data)} bars")
+def test_strategy(strategy, strategy_name, data, engine, symbol='AAPL', period='1y'):
+    """Test a single strategy on pre-fetched data and print results."""
+    print(f"\n{_BANNER}\nTesting: {strategy_name}\nSymbol: {symbol} | Period: {period}\n{_BANNER}")
 
+    try:
         # Run backtest
         print("Running backtest...")
-        engine = BacktestEngine(
-            initial_capital=100000,
-            commission=0.001,  # 0.1%
-            slippage=0.0005    # 0.05%
-        )
 
         # BacktestEngine.run_backtest takes (strategy, data, ticker)
         results = engine.run_backtest(strategy, data, symbol)
 
-        # Count signals from results
-        signals_df = results.signals
-        buy_signals = (signals_df['signal'] == 1).sum()
-        sell_signals = (signals_df['signal'] == -1).sum()
+        # Count signals from results (one pass: bins are sell, hold, buy)
+        sell_signals, _, buy_signals = np.bincount(results.signals_arr + 1, minlength=3)
         print(f"✓ Buy signals: {buy_signals}, Sell signals: {sell_signals}")
 
         metrics = results.metrics
 
         # Print results
-        print(f"\n{'-'*60}")
-        print("BACKTEST RESULTS")
-        print(f"{'-'*60}")
-        print(f"Initial Capital:     ${metrics.initial_portfolio_value:,.2f}")
-        print(f"Final Value:         ${metrics.final_portfolio_value:,.2f}")
-        print(f"Total Return:        {metrics.total_return*100:.2f}%")
-        print(f"CAGR:                {metrics.cagr*100:.2f}%")
-        print(f"Sharpe Ratio:        {metrics.sharpe_ratio:.2f}")
-        print(f"Max Drawdown:        {metrics.max_drawdown*100:.2f}%")
-        print(f"\nTotal Trades:        {metrics.total_trades}")
-        print(f"Winning Trades:      {metrics.winning_trades}")
-        print(f"Losing Trades:       {metrics.losing_trades}")
-        print(f"Win Rate:            {metrics.win_rate*100:.1f}%")
-        print(f"Profit Factor:       {metrics.profit_factor:.2f}")
-        print(f"Avg Win:             ${metrics.average_win:,.2f}")
-        print(f"Avg Loss:            ${metrics.average_loss:,.2f}")
+        print(_RESULTS_FMT.format_map(metrics.to_dict()))
 
         # Determine if strategy is profitable
         if metrics.total_return > 0:
@@ -101,9 +109,7 @@ def test_strategy(strategy, strategy_name, symbol='AAPL', period='1y'):
 
 def main():
     """Run tests for all new strategies."""
-    print("\n" + "="*60)
-    print(" TESTING PHASE 1 SIGNAL STRATEGIES")
-    print("="*60)
+    print(f"\n{_BANNER}\n TESTING PHASE 1 SIGNAL STRATEGIES\n{_BANNER}")
 
     test_symbols = ['AAPL']  # Can expand to ['AAPL', 'MSFT', 'TSLA'] for more thorough testing
 
@@ -113,6 +119,13 @@ def main():
         (BB_Standard(), "Bollinger Band 20,2 Mean Reversion"),
     ]
 
+    # One engine is shared by every run; it keeps no state between backtests
+    engine = BacktestEngine(
+        initial_capital=100000,
+        commission=0.001,  # 0.1%
+        slippage=0.0005    # 0.05%
+    )
+
     results = {}
 
     for symbol in test_symbols:
@@ -120,17 +133,22 @@ def main():
         print(f"# Testing Symbol: {symbol}")
         print(f"{'#'*60}")
 
+        # Fetch once per symbol and reuse it for every strategy
+        data = fetch_test_data(symbol)
+
         symbol_results = {}
         for strategy, name in strategies:
-            success = test_strategy(strategy, name, symbol)
+            if data is None:
+                symbol_results[name] = False
+                continue
+
+            success = test_strategy(strategy, name, data, engine, symbol)
             symbol_results[name] = success
 
         results[symbol] = symbol_results
 
     # Print summary
-    print("\n\n" + "="*60)
-    print(" TEST SUMMARY")
-    print("="*60)
+    print(f"\n\n{_BANNER}\n TEST SUMMARY\n{_BANNER}")
 
     for symbol, strategy_results in results.items():
         print(f"\n{symbol}:")
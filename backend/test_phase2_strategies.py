@@ -8,10 +8,16 @@ Tests:
 
 Each test performs a real backtest on AAPL with 1-year data.
 """
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add backend directory to path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
@@ -31,46 +37,144 @@ from app.services.strategy.examples.donchian_strategy import (
     Donchian50_25,
     Donchian10_5Fast
 )
-from app.services.backtesting.engine import BacktestEngine
 from app.services.data.market_data import fetch_stock_data
+from app.services.data.shared_ohlcv import share_ohlcv, attach_ohlcv
+from app.services.strategy.indicators import precompute
+from app.services.strategy.kernels import warmup
+from phase_test_common import create_engine, error_record, print_errors, write_results_jsonl
+
+# Console separators, built once
+_BANNER = '=' * 80
+_RULE = '─' * 80
+_SEP = '-' * 80
+
+# Results block, filled from PerformanceMetrics.to_dict()
+_RESULTS_FMT = f"""
+{_RULE}
+BACKTEST RESULTS
+{_RULE}
+
+📊 RETURNS:
+  Initial Capital:     ${{initial_portfolio_value:,.2f}}
+  Final Capital:       ${{final_portfolio_value:,.2f}}
+  Total Return:        {{total_return_pct:.2f}}%
+  CAGR:                {{cagr_pct:.2f}}%
+
+📉 RISK METRICS:
+  Max Drawdown:        {{max_drawdown_pct:.2f}}%
+  Sharpe Ratio:        {{sharpe_ratio:.2f}}
+  Sortino Ratio:       {{sortino_ratio:.2f}}
+
+📈 TRADE STATISTICS:
+  Total Trades:        {{total_trades}}
+  Winning Trades:      {{winning_trades}}
+  Losing Trades:       {{losing_trades}}
+  Win Rate:            {{win_rate_pct:.1f}}%
+  Profit Factor:       {{profit_factor:.2f}}
+  Avg Win:             ${{average_win:,.2f}}
+  Avg Loss:            ${{average_loss:,.2f}}"""
+
+# One row per backtest. Workers return plain tuples in this field order (all
+# but the category, which the parent appends) and the parent packs them into
+# a structured array
+_RESULT_DTYPE = np.dtype([
+    ('name', 'U64'),
+    ('total_return', 'f8'),
+    ('win_rate', 'f8'),
+    ('total_trades', 'i4'),
+    ('sharpe_ratio', 'f8'),
+    ('max_drawdown', 'f8'),
+    ('category', 'U16')
+])
+
+# Phase 2 strategy variants, by category
+_STRATEGY_GROUPS = {
+    'ADX': [
+        ADX25,
+        ADX30Conservative,
+        ADX20Aggressive
+    ],
+    'Stochastic': [
+        Stochastic14_3,
+        StochasticSlow,
+        StochasticFast
+    ],
+    'Donchian': [
+        Donchian20_10,
+        Donchian50_25,
+        Donchian10_5Fast
+    ]
+}
+
+_RESULTS_PATH = backend_dir / 'output' / 'phase2_results.jsonl'
+
+# Summary table layout: result keys, column headers and cell formats
+# (the name header is padded so it lines up with the left-aligned names)
+_SUMMARY_COLUMNS = ['name', 'category', 'total_return', 'total_trades', 'win_rate', 'sharpe_ratio', 'max_drawdown']
+_SUMMARY_HEADER = [f"{'Strategy':<35}", f"{'Category':<12}", 'Return', 'Trades', 'Win%', 'Sharpe', 'MaxDD']
+_SUMMARY_FORMATTERS = {
+    'name': '{:<35}'.format,
+    'category': '{:<12}'.format,
+    'total_return': '{:.2f}%'.format,
+    'win_rate': '{:.1f}%'.format,
+    'sharpe_ratio': '{:.2f}'.format,
+    'max_drawdown': '{:.2f}%'.format
+}
+
+
+# Successfully fetched bars by (symbol, start_date, end_date)
+_data_cache = {}
 
 
-def run_backtest(strategy, symbol='AAPL', days=365):
+def fetch_data(symbol, start_date, end_date):
     """
-    Run a backtest for a given strategy.
+    Fetch market data once per (symbol, start_date, end_date).
 
-    Args:
-        strategy: Strategy instance
-        symbol: Stock symbol (default: AAPL)
-        days: Number of days of historical data (default: 365)
+    Every strategy variant is tested on the same bars, so repeat requests
+    are served from memory instead of refetching. Failed fetches are not
+    cached, so a later call tries again.
 
     Returns:
-        dict: Backtest results
+        DataFrame with OHLCV data, or None if the fetch failed
     """
-    print(f"\n{'='*80}")
-    print(f"Testing: {strategy.name}")
-    print(f"{'='*80}")
-
-    # Fetch data
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
+    key = (symbol, start_date, end_date)
+    if key in _data_cache:
+        return _data_cache[key]
 
-    print(f"Fetching {symbol} data from {start_date.date()} to {end_date.date()}...")
-    data = fetch_stock_data(symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+    print(f"Fetching {symbol} data from {start_date} to {end_date}...")
+    data = fetch_stock_data(symbol, start_date, end_date)
 
     if data is None or len(data) == 0:
         print(f"❌ Failed to fetch data for {symbol}")
         return None
 
     print(f"✓ Fetched {len(data)} bars")
+    _data_cache[key] = data
+    return data
+
+
+def run_backtest(strategy, data, engine, symbol='AAPL'):
+    """
+    Run a backtest for a given strategy.
+
+    Args:
+        strategy: Strategy instance
+        data: OHLCV DataFrame to test on
+        engine: BacktestEngine shared by all runs
+        symbol: Stock symbol (default: AAPL)
+
+    Returns:
+        tuple: Backtest results in _RESULT_DTYPE field order, or an error
+        record ({'name', 'error', 'tb'}) if the backtest failed
+
+    The report is built in memory and written to stdout in one call, so
+    reports from parallel workers never interleave.
+    """
+    report = io.StringIO()
+    report.write(f"\n{_BANNER}\nTesting: {strategy.name}\n{_BANNER}\n")
 
     # Run backtest
-    print(f"\nRunning backtest...")
-    engine = BacktestEngine(
-        initial_capital=100000,
-        commission=0.001,  # 0.1%
-        slippage=0.0005    # 0.05%
-    )
+    report.write("\nRunning backtest...\n")
 
     try:
         results = engine.run_backtest(strategy, data, symbol)
@@ -78,143 +182,161 @@ def run_backtest(strategy, symbol='AAPL', days=365):
         # Extract metrics
         metrics = results.metrics
 
-        # Print results
-        print(f"\n{'─'*80}")
-        print(f"BACKTEST RESULTS")
-        print(f"{'─'*80}")
-        print(f"\n📊 RETURNS:")
-        print(f"  Initial Capital:     ${metrics.initial_portfolio_value:,.2f}")
-        print(f"  Final Capital:       ${metrics.final_portfolio_value:,.2f}")
-        print(f"  Total Return:        {metrics.total_return*100:.2f}%")
-        print(f"  CAGR:                {metrics.cagr*100:.2f}%")
-
-        print(f"\n📉 RISK METRICS:")
-        print(f"  Max Drawdown:        {metrics.max_drawdown*100:.2f}%")
-        print(f"  Sharpe Ratio:        {metrics.sharpe_ratio:.2f}")
-        print(f"  Sortino Ratio:       {metrics.sortino_ratio:.2f}")
-
-        print(f"\n📈 TRADE STATISTICS:")
-        print(f"  Total Trades:        {metrics.total_trades}")
-        print(f"  Winning Trades:      {metrics.winning_trades}")
-        print(f"  Losing Trades:       {metrics.losing_trades}")
-        print(f"  Win Rate:            {metrics.win_rate*100:.1f}%")
-        print(f"  Profit Factor:       {metrics.profit_factor:.2f}")
-        print(f"  Avg Win:             ${metrics.average_win:,.2f}")
-        print(f"  Avg Loss:            ${metrics.average_loss:,.2f}")
-
-        return {
-            'name': strategy.name,
-            'total_return': metrics.total_return * 100,
-            'win_rate': metrics.win_rate * 100,
-            'total_trades': metrics.total_trades,
-            'sharpe_ratio': metrics.sharpe_ratio,
-            'max_drawdown': metrics.max_drawdown * 100
-        }
+        # Report results
+        report.write(_RESULTS_FMT.format_map(metrics.to_dict()))
+        report.write("\n")
+
+        return (
+            strategy.name,
+            metrics.total_return * 100,
+            metrics.win_rate * 100,
+            metrics.total_trades,
+            metrics.sharpe_ratio,
+            metrics.max_drawdown * 100
+        )
 
     except Exception as e:
-        print(f"❌ Backtest failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return None
+        report.write(f"❌ Backtest failed: {str(e)}\n")
+        return error_record(strategy.name, e)
 
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
 
-def test_adx_strategies():
-    """Test all ADX strategy variants."""
-    print("\n" + "="*80)
-    print("PHASE 2 - ADX TREND STRENGTH STRATEGIES")
-    print("="*80)
 
-    strategies = [
-        ADX25(),
-        ADX30Conservative(),
-        ADX20Aggressive()
-    ]
+# Per-worker state for the backtest pool. The initializer sends the shared
+# indicators, engine and symbol once per worker rather than with every task;
+# the bars are mapped from shared memory instead of being pickled.
+_worker_shm = None
+_worker_data = None
+_worker_indicators = None
+_worker_engine = None
+_worker_symbol = None
 
-    results = []
-    for strategy in strategies:
-        result = run_backtest(strategy)
-        if result:
-            results.append(result)
 
-    return results
+def _init_worker(data_spec, indicators, engine, symbol):
+    """Process pool initializer: attach the shared bars and store the test inputs in the worker."""
+    global _worker_shm, _worker_data, _worker_indicators, _worker_engine, _worker_symbol
+    _worker_shm, _worker_data = attach_ohlcv(data_spec)
+    _worker_indicators = indicators
+    _worker_engine = engine
+    _worker_symbol = symbol
 
 
-def test_stochastic_strategies():
-    """Test all Stochastic strategy variants."""
-    print("\n" + "="*80)
-    print("PHASE 2 - STOCHASTIC OSCILLATOR STRATEGIES")
-    print("="*80)
+def _backtest_job(strategy_class):
+    """
+    Process pool entry point for run_backtest.
 
-    strategies = [
-        Stochastic14_3(),
-        StochasticSlow(),
-        StochasticFast()
-    ]
+    The strategy is built inside the worker from its class and given the
+    shared indicator cache.
 
-    results = []
-    for strategy in strategies:
-        result = run_backtest(strategy)
-        if result:
-            results.append(result)
+    Returns:
+        tuple: Backtest results, or an error record if the backtest failed
+    """
+    strategy = strategy_class().use_precomputed(_worker_indicators)
+    return run_backtest(strategy, _worker_data, _worker_engine, _worker_symbol)
 
-    return results
 
+def run_backtests_parallel(strategy_groups, start_date, end_date, symbol='AAPL'):
+    """
+    Backtest every strategy of every category in one parallel submission.
 
-def test_donchian_strategies():
-    """Test all Donchian strategy variants."""
-    print("\n" + "="*80)
-    print("PHASE 2 - DONCHIAN CHANNEL BREAKOUT STRATEGIES")
-    print("="*80)
+    All strategies share one pool, so a slow strategy in one category no
+    longer holds back the start of the next category. Each worker prints
+    its own report as soon as its backtest finishes. Failed backtests are
+    summarized in one line each once all have run.
 
-    strategies = [
-        Donchian20_10(),
-        Donchian50_25(),
-        Donchian10_5Fast()
+    Args:
+        strategy_groups: Mapping of category name to strategy classes
+        start_date: First day of data (YYYY-MM-DD)
+        end_date: Last day of data (YYYY-MM-DD)
+        symbol: Stock symbol (default: AAPL)
+
+    Returns:
+        Structured array (_RESULT_DTYPE) of the successful backtests,
+        tagged with their category
+    """
+    jobs = [
+        (category, strategy_class)
+        for category, strategy_classes in strategy_groups.items()
+        for strategy_class in strategy_classes
     ]
 
-    results = []
-    for strategy in strategies:
-        result = run_backtest(strategy)
-        if result:
-            results.append(result)
+    # Fetch once and hand the same bars to every strategy
+    data = fetch_data(symbol, start_date, end_date)
+    if data is None:
+        return np.empty(0, dtype=_RESULT_DTYPE)
+
+    # Variants of one strategy share most indicators: compute each only once
+    indicators = precompute(data, (
+        key
+        for _, strategy_class in jobs
+        for key in strategy_class().required_indicators()
+    ))
+
+    engine = create_engine()
 
-    return results
+    results = np.empty(len(jobs), dtype=_RESULT_DTYPE)
+    count = 0
+    errors = []
+    workers = min(len(jobs), os.cpu_count() or 1)
+
+    # Workers map the bars from one shared memory block instead of each
+    # unpickling its own copy
+    shm, data_spec = share_ohlcv(data)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(data_spec, indicators, engine, symbol)
+        ) as executor:
+            futures = [
+                executor.submit(_backtest_job, strategy_class)
+                for _, strategy_class in jobs
+            ]
+
+            for (category, _), future in zip(jobs, futures):
+                result = future.result()
+                if isinstance(result, dict):
+                    errors.append(result)
+                else:
+                    results[count] = result + (category,)
+                    count += 1
+    finally:
+        shm.close()
+        shm.unlink()
+
+    print_errors(errors, mark='❌')
+
+    return results[:count]
 
 
 def print_summary(all_results):
-    """Print summary comparison of all strategies."""
-    print("\n" + "="*80)
-    print("PHASE 2 STRATEGIES - SUMMARY COMPARISON")
-    print("="*80)
+    """Print summary comparison of all strategies (a _RESULT_DTYPE array)."""
+    print(f"\n{_BANNER}\nPHASE 2 STRATEGIES - SUMMARY COMPARISON\n{_BANNER}")
 
-    if not all_results:
+    if len(all_results) == 0:
         print("No results to display")
         return
 
-    # Sort by total return
-    sorted_results = sorted(all_results, key=lambda x: x['total_return'], reverse=True)
+    results = pd.DataFrame(all_results)
 
-    print(f"\n{'Strategy':<35} {'Return':<10} {'Trades':<8} {'Win%':<8} {'Sharpe':<8} {'MaxDD':<8}")
-    print("-" * 80)
-
-    for r in sorted_results:
-        print(
-            f"{r['name']:<35} "
-            f"{r['total_return']:>8.2f}% "
-            f"{r['total_trades']:>7} "
-            f"{r['win_rate']:>7.1f}% "
-            f"{r['sharpe_ratio']:>7.2f} "
-            f"{r['max_drawdown']:>7.2f}%"
-        )
+    # Sort by total return and format the whole table in one call
+    table = results.sort_values('total_return', ascending=False, kind='stable')
+    print()
+    print(table.to_string(
+        index=False,
+        columns=_SUMMARY_COLUMNS,
+        header=_SUMMARY_HEADER,
+        formatters=_SUMMARY_FORMATTERS
+    ))
 
     # Best performers
-    print(f"\n{'='*80}")
-    print("BEST PERFORMERS")
-    print(f"{'='*80}")
+    print(f"\n{_BANNER}\nBEST PERFORMERS\n{_BANNER}")
 
-    best_return = max(all_results, key=lambda x: x['total_return'])
-    best_winrate = max(all_results, key=lambda x: x['win_rate'])
-    best_sharpe = max(all_results, key=lambda x: x['sharpe_ratio'])
+    best_return = results.nlargest(1, 'total_return').iloc[0]
+    best_winrate = results.nlargest(1, 'win_rate').iloc[0]
+    best_sharpe = results.nlargest(1, 'sharpe_ratio').iloc[0]
 
     print(f"🏆 Highest Return:   {best_return['name']:<35} ({best_return['total_return']:.2f}%)")
     print(f"🎯 Highest Win Rate: {best_winrate['name']:<35} ({best_winrate['win_rate']:.1f}%)")
@@ -222,9 +344,7 @@ def print_summary(all_results):
 
 
 if __name__ == '__main__':
-    print("\n" + "="*80)
-    print("PHASE 2 SIGNAL STRATEGIES - COMPREHENSIVE TEST SUITE")
-    print("="*80)
+    print(f"\n{_BANNER}\nPHASE 2 SIGNAL STRATEGIES - COMPREHENSIVE TEST SUITE\n{_BANNER}")
     print(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Symbol: AAPL")
     print(f"Period: 1 year")
@@ -232,26 +352,22 @@ if __name__ == '__main__':
     print(f"Commission: 0.1%")
     print(f"Slippage: 0.05%")
 
-    all_results = []
-
-    # Test ADX strategies
-    adx_results = test_adx_strategies()
-    if adx_results:
-        all_results.extend(adx_results)
+    # Run the compiled kernels once before the pool starts, so a kernel
+    # problem surfaces here instead of in every worker
+    warmup()
 
-    # Test Stochastic strategies
-    stoch_results = test_stochastic_strategies()
-    if stoch_results:
-        all_results.extend(stoch_results)
+    # One date range for every strategy
+    today = datetime.now()
+    start_date = (today - timedelta(days=365)).strftime('%Y-%m-%d')
+    end_date = today.strftime('%Y-%m-%d')
 
-    # Test Donchian strategies
-    donchian_results = test_donchian_strategies()
-    if donchian_results:
-        all_results.extend(donchian_results)
+    # Test ADX, Stochastic and Donchian strategies together
+    print(f"\n{_BANNER}\nPHASE 2 - ADX, STOCHASTIC AND DONCHIAN STRATEGIES\n{_BANNER}")
+    all_results = run_backtests_parallel(_STRATEGY_GROUPS, start_date, end_date)
 
     # Print summary
     print_summary(all_results)
+    write_results_jsonl(all_results, _RESULTS_PATH)
+    print(f"\nResults written to {_RESULTS_PATH}")
 
-    print("\n" + "="*80)
-    print("✅ PHASE 2 TESTING COMPLETE")
-    print("="*80)
+    print(f"\n{_BANNER}\n✅ PHASE 2 TESTING COMPLETE\n{_BANNER}")
@@ -3,15 +3,23 @@ Test Suite for Phase 3: Volume-Based Strategies
 
 Tests OBV, A/D Line, and VWMA strategies on real market data.
 """
+import io
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from datetime import datetime
-from app.services.backtesting.engine import BacktestEngine
-from app.services.data import fetch_stock_data
+from app.services.data import fetch_stock_data, share_ohlcv, attach_ohlcv
+from app.services.strategy.indicators import precompute
+from app.services.strategy.kernels import warmup
+from phase_test_common import create_engine, error_record, print_errors, write_results_jsonl
 
 # Import Phase 3 strategies
 from app.services.strategy.examples.obv_strategy import (
@@ -39,76 +47,154 @@ from app.services.strategy.examples.vwma_strategy import (
     VWMAPrice50
 )
 
-
-def test_strategy(strategy_class, strategy_name, symbol='AAPL', start_date='2024-01-01', end_date='2024-12-31'):
-    """Test a single strategy on given data."""
-    print(f"\n{'='*80}")
-    print(f"Testing: {strategy_name}")
-    print(f"Symbol: {symbol} | Period: {start_date} to {end_date}")
-    print(f"{'='*80}")
+# Console separators, built once
+_BANNER = '=' * 80
+_RULE = '─' * 80
+
+# Results blocks, filled from PerformanceMetrics.to_dict() plus 'alpha'
+_RESULTS_FMT = f"""
+{_RULE}
+RESULTS:
+{_RULE}
+Total Return:      {{total_return_pct:>8.2f}}%
+Buy & Hold Return: {{buy_hold_return_pct:>8.2f}}%
+Alpha:             {{alpha:>8.2f}}%
+Total Trades:      {{total_trades:>8}}
+Win Rate:          {{win_rate_pct:>8.2f}}%
+Sharpe Ratio:      {{sharpe_ratio:>8.2f}}
+Max Drawdown:      {{max_drawdown_pct:>8.2f}}%"""
+
+_TRADE_DETAILS_FMT = """
+Trade Details:
+  Avg Win:         ${average_win:>8.2f}
+  Avg Loss:        ${average_loss:>8.2f}
+  Profit Factor:   {profit_factor:>8.2f}"""
+
+# One row per strategy. Workers return plain tuples in this field order and
+# main() packs them into a structured array
+_RESULT_DTYPE = np.dtype([
+    ('name', 'U64'),
+    ('return', 'f8'),
+    ('sharpe', 'f8'),
+    ('trades', 'i4'),
+    ('win_rate', 'f8'),
+    ('max_dd', 'f8')
+])
+
+_RESULTS_PATH = Path(__file__).parent / 'output' / 'phase3_results.jsonl'
+
+# Summary table layout: result keys, column headers and cell formats
+# (the name header is padded so it lines up with the left-aligned names)
+_SUMMARY_COLUMNS = ['name', 'return', 'sharpe', 'trades', 'win_rate', 'max_dd']
+_SUMMARY_HEADER = [f"{'Strategy':<40}", 'Return', 'Sharpe', 'Trades', 'WinRate', 'MaxDD']
+_SUMMARY_FORMATTERS = {
+    'name': '{:<40}'.format,
+    'return': '{:.2f}%'.format,
+    'sharpe': '{:.2f}'.format,
+    'win_rate': lambda rate: f"{rate * 100:.1f}%",
+    'max_dd': '{:.2f}%'.format
+}
+
+
+def test_strategy(strategy_class, strategy_name, data, engine, symbol='AAPL', start_date='2024-01-01',
+                  end_date='2024-12-31', indicators=None):
+    """
+    Test a single strategy on given (pre-fetched) data and optional shared indicators.
+
+    The report is built in memory and written to stdout in one call, so
+    reports from parallel workers never interleave.
+    """
+    report = io.StringIO()
+    report.write(f"\n{_BANNER}\nTesting: {strategy_name}\nSymbol: {symbol} | Period: {start_date} to {end_date}\n{_BANNER}\n")
 
     try:
-        # Fetch data
-        data = fetch_stock_data(symbol=symbol, start_date=start_date, end_date=end_date, interval='1d')
-        print(f"✓ Fetched {len(data)} bars of data")
-
         # Create strategy instance
         config = {'name': strategy_name}
         strategy = strategy_class(config)
+        if indicators:
+            strategy.use_precomputed(indicators)
 
         # Run backtest
-        engine = BacktestEngine(initial_capital=100000, commission=0.001, slippage=0.0005)
         result = engine.run_backtest(strategy=strategy, data=data, ticker=symbol)
 
         # Extract metrics
         m = result.metrics
 
-        # Calculate percentage returns
-        total_return_pct = m.total_return * 100
-        buy_hold_return_pct = m.buy_hold_return * 100
-        alpha = total_return_pct - buy_hold_return_pct
-        max_drawdown_pct = m.max_drawdown * 100
-
-        # Print results
-        print(f"\n{'─'*80}")
-        print(f"RESULTS:")
-        print(f"{'─'*80}")
-        print(f"Total Return:      {total_return_pct:>8.2f}%")
-        print(f"Buy & Hold Return: {buy_hold_return_pct:>8.2f}%")
-        print(f"Alpha:             {alpha:>8.2f}%")
-        print(f"Total Trades:      {m.total_trades:>8}")
-        print(f"Win Rate:          {m.win_rate*100:>8.2f}%")
-        print(f"Sharpe Ratio:      {m.sharpe_ratio:>8.2f}")
-        print(f"Max Drawdown:      {max_drawdown_pct:>8.2f}%")
+        # Percentage values for the report
+        values = m.to_dict()
+        total_return_pct = values['total_return_pct']
+        max_drawdown_pct = values['max_drawdown_pct']
+        values['alpha'] = total_return_pct - values['buy_hold_return_pct']
+
+        # Report results
+        report.write(_RESULTS_FMT.format_map(values))
+        report.write("\n")
 
         if m.total_trades > 0:
-            print(f"\nTrade Details:")
-            print(f"  Avg Win:         ${m.average_win:>8.2f}")
-            print(f"  Avg Loss:        ${m.average_loss:>8.2f}")
-            print(f"  Profit Factor:   {m.profit_factor:>8.2f}")
-
-        # Return summary dict for aggregation
-        return {
-            'name': strategy_name,
-            'return': total_return_pct,
-            'sharpe': m.sharpe_ratio,
-            'trades': m.total_trades,
-            'win_rate': m.win_rate,
-            'max_dd': max_drawdown_pct
-        }
+            report.write(_TRADE_DETAILS_FMT.format_map(values))
+            report.write("\n")
+
+        # Return summary row (_RESULT_DTYPE field order) for aggregation
+        return (
+            strategy_name,
+            total_return_pct,
+            m.sharpe_ratio,
+            m.total_trades,
+            m.win_rate,
+            max_drawdown_pct
+        )
 
     except Exception as e:
-        print(f"✗ Error testing {strategy_name}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return None
+        report.write(f"✗ Error testing {strategy_name}: {str(e)}\n")
+        return error_record(strategy_name, e)
+
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+
+# Per-worker state for the strategy pool. The initializer sends the shared
+# indicators, engine and test period once per worker rather than with every
+# task; the bars are mapped from shared memory instead of being pickled.
+_worker_shm = None
+_worker_data = None
+_worker_indicators = None
+_worker_engine = None
+_worker_period = None
+
+
+def _init_worker(data_spec, indicators, engine, symbol, start_date, end_date):
+    """Pool initializer: attach the shared bars and store the test inputs in the worker."""
+    global _worker_shm, _worker_data, _worker_indicators, _worker_engine, _worker_period
+    _worker_shm, _worker_data = attach_ohlcv(data_spec)
+    _worker_indicators = indicators
+    _worker_engine = engine
+    _worker_period = (symbol, start_date, end_date)
+
+
+def _test_job(strategy):
+    """
+    Pool entry point for test_strategy.
+
+    Args:
+        strategy: (strategy_class, strategy_name) tuple
+
+    Returns:
+        tuple: Summary row of the test, or an error record
+        ({'name', 'error', 'tb'}) if it failed
+    """
+    strategy_class, strategy_name = strategy
+    symbol, start_date, end_date = _worker_period
+
+    return test_strategy(
+        strategy_class, strategy_name, _worker_data, _worker_engine,
+        symbol, start_date, end_date, _worker_indicators
+    )
 
 
 def main():
     """Run all Phase 3 strategy tests."""
-    print("\n" + "="*80)
-    print(" PHASE 3 STRATEGY TEST SUITE - VOLUME-BASED STRATEGIES")
-    print("="*80)
+    print(f"\n{_BANNER}\n PHASE 3 STRATEGY TEST SUITE - VOLUME-BASED STRATEGIES\n{_BANNER}")
 
     # Test parameters
     symbol = 'AAPL'
@@ -142,46 +228,93 @@ def main():
         (VWMAPrice50, "VWMA Price Position 50"),
     ]
 
-    # Run tests and collect results
-    results = []
-    for strategy_class, strategy_name in strategies:
-        result = test_strategy(strategy_class, strategy_name, symbol, start_date, end_date)
-        if result:
-            results.append(result)
+    # Fetch once; every strategy is tested on the same bars
+    try:
+        data = fetch_stock_data(symbol=symbol, start_date=start_date, end_date=end_date, interval='1d')
+    except Exception as e:
+        print(f"✗ Error fetching {symbol} data: {str(e)}")
+        return
+    if data is None or len(data) == 0:
+        print(f"✗ No data returned for {symbol}")
+        return
+    print(f"✓ Fetched {len(data)} bars of data")
+
+    # OBV, A/D and VWMA variants share their base series: compute each only once
+    indicators = precompute(data, (
+        key
+        for strategy_class, strategy_name in strategies
+        for key in strategy_class({'name': strategy_name}).required_indicators()
+    ))
+
+    engine = create_engine()
+
+    # Load the compiled kernels and run them once before forking the pool
+    warmup()
+
+    results = np.empty(len(strategies), dtype=_RESULT_DTYPE)
+    count = 0
+    errors = []
+    workers = min(len(strategies), os.cpu_count() or 1)
+
+    # Workers map the bars from one shared memory block instead of each
+    # unpickling its own copy
+    shm, data_spec = share_ohlcv(data)
+    try:
+        with multiprocessing.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(data_spec, indicators, engine, symbol, start_date, end_date)
+        ) as pool:
+            for result in pool.imap_unordered(_test_job, strategies, chunksize=2):
+                if isinstance(result, dict):
+                    errors.append(result)
+                else:
+                    results[count] = result
+                    count += 1
+    finally:
+        shm.close()
+        shm.unlink()
+
+    print_errors(errors)
+
+    # Drop the rows of strategies that failed
+    results = results[:count]
 
     # Print summary
-    print("\n" + "="*80)
-    print(" TEST SUMMARY - ALL PHASE 3 STRATEGIES")
-    print("="*80)
+    print(f"\n{_BANNER}\n TEST SUMMARY - ALL PHASE 3 STRATEGIES\n{_BANNER}")
     print(f"Total Strategies Tested: {len(results)}")
 
-    # Sort by return
-    results.sort(key=lambda x: x['return'], reverse=True)
-
-    print(f"\n{'Strategy':<40} {'Return':>10} {'Sharpe':>8} {'Trades':>8} {'WinRate':>8} {'MaxDD':>8}")
-    print("─"*95)
-    for r in results:
-        print(f"{r['name']:<40} {r['return']:>9.2f}% {r['sharpe']:>8.2f} {r['trades']:>8} {r['win_rate']*100:>7.1f}% {r['max_dd']:>7.2f}%")
-
-    # Highlight best performers
-    if results:
-        print("\n" + "="*80)
-        print(" TOP PERFORMERS")
-        print("="*80)
-        print(f"Best Return:       {results[0]['name']} ({results[0]['return']:.2f}%)")
-
-        best_sharpe = max(results, key=lambda x: x['sharpe'])
+    # Sort by return and format the whole table in one call
+    if len(results):
+        summary = pd.DataFrame(results)
+        table = summary.sort_values('return', ascending=False, kind='stable')
+        print()
+        print(table.to_string(
+            index=False,
+            columns=_SUMMARY_COLUMNS,
+            header=_SUMMARY_HEADER,
+            formatters=_SUMMARY_FORMATTERS
+        ))
+
+        # Highlight best performers
+        print(f"\n{_BANNER}\n TOP PERFORMERS\n{_BANNER}")
+
+        best_return = summary.nlargest(1, 'return').iloc[0]
+        print(f"Best Return:       {best_return['name']} ({best_return['return']:.2f}%)")
+
+        best_sharpe = summary.nlargest(1, 'sharpe').iloc[0]
         print(f"Best Sharpe:       {best_sharpe['name']} ({best_sharpe['sharpe']:.2f})")
 
-        best_win_rate = max(results, key=lambda x: x['win_rate'])
+        best_win_rate = summary.nlargest(1, 'win_rate').iloc[0]
         print(f"Best Win Rate:     {best_win_rate['name']} ({best_win_rate['win_rate']*100:.1f}%)")
 
-        most_trades = max(results, key=lambda x: x['trades'])
+        most_trades = summary.nlargest(1, 'trades').iloc[0]
         print(f"Most Trades:       {most_trades['name']} ({most_trades['trades']} trades)")
 
-    print("\n" + "="*80)
-    print(" PHASE 3 TESTING COMPLETE")
-    print("="*80 + "\n")
+    write_results_jsonl(results, _RESULTS_PATH)
+    print(f"\nResults written to {_RESULTS_PATH}")
+
+    print(f"\n{_BANNER}\n PHASE 3 TESTING COMPLETE\n{_BANNER}\n")
 
 
 if __name__ == "__main__":
@@ -34,14 +34,14 @@ def main():
 
     if strategies:
         for strategy in strategies:
-            print(f"\n✓ {strategy['name']}")
-            print(f"   Class: {strategy['class']}")
-            if 'description' in strategy:
-                print(f"   Description: {strategy['description']}")
-            if 'complexity' in strategy:
-                print(f"   Complexity: {strategy['complexity']}")
-            if 'tags' in strategy:
-                print(f"   Tags: {', '.join(strategy['tags'])}")
+            print(f"\n✓ {strategy.name}")
+            print(f"   Class: {strategy.class_name}")
+            if strategy.description is not None:
+                print(f"   Description: {strategy.description}")
+            if strategy.complexity is not None:
+                print(f"   Complexity: {strategy.complexity}")
+            if strategy.tags:
+                print(f"   Tags: {', '.join(strategy.tags)}")
     else:
         print("⚠️  No strategies registered yet")
 
@@ -0,0 +1,130 @@
+"""
+Unit tests for the data services.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.data import share_ohlcv, attach_ohlcv, market_data
+from app.services.strategy import indicators
+
+
+def _ohlcv(n=60):
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame(
+        {
+            'open': close + rng.standard_normal(n) * 0.1,
+            'high': close + 1.0,
+            'low': close - 1.0,
+            'close': close,
+            'volume': rng.integers(1_000, 10_000, n),
+        },
+        index=pd.date_range('2024-01-01', periods=n, freq='D', name='Date'),
+    )
+
+
+def test_shared_ohlcv_round_trip():
+    data = _ohlcv()
+    shm, spec = share_ohlcv(data)
+    try:
+        attached_shm, attached = attach_ohlcv(spec)
+        try:
+            pd.testing.assert_frame_equal(attached, data, check_freq=False)
+            assert not attached['close'].to_numpy().flags.writeable
+        finally:
+            del attached
+            attached_shm.close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_share_ohlcv_rejects_object_columns():
+    data = _ohlcv()
+    data['symbol'] = 'AAPL'
+    with pytest.raises(ValueError, match="symbol"):
+        share_ohlcv(data)
+
+
+def test_share_ohlcv_rejects_reserved_column_name():
+    data = _ohlcv()
+    data['index'] = np.arange(len(data))
+    with pytest.raises(ValueError, match="index"):
+        share_ohlcv(data)
+
+
+def test_indicators_accept_attached_frame():
+    """Compiled indicator paths must accept the read-only shared-memory views."""
+    data = _ohlcv()
+    shm, spec = share_ohlcv(data)
+    try:
+        attached_shm, attached = attach_ohlcv(spec)
+        try:
+            pd.testing.assert_series_equal(
+                indicators.rolling_max(attached['high'], 10),
+                indicators.rolling_max(data['high'], 10),
+                check_freq=False
+            )
+            pd.testing.assert_series_equal(
+                indicators.rolling_min(attached['low'], 10),
+                indicators.rolling_min(data['low'], 10),
+                check_freq=False
+            )
+            pd.testing.assert_series_equal(
+                indicators.obv(attached['close'], attached['volume']),
+                indicators.obv(data['close'], data['volume']),
+                check_freq=False
+            )
+        finally:
+            del attached
+            attached_shm.close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+@pytest.fixture
+def demo_fetches(tmp_path, monkeypatch):
+    """Point the demo cache at tmp_path and count the (stubbed) downloads."""
+    fetches = []
+
+    def fake_fetch(symbol, start_date, end_date):
+        fetches.append(symbol)
+        return _ohlcv()
+
+    monkeypatch.setattr(market_data, 'DEMO_CACHE_DIR', tmp_path)
+    monkeypatch.setattr(market_data, 'fetch_stock_data', fake_fetch)
+    monkeypatch.setattr(market_data, 'get_stock_info', lambda symbol: {'symbol': symbol})
+    monkeypatch.setattr(market_data, 'validate_data_quality', lambda data, symbol: (True, []))
+    return fetches
+
+
+def test_demo_cache_is_opt_in(demo_fetches, tmp_path):
+    market_data.fetch_demo_stock('AAPL')
+    market_data.fetch_demo_stock('AAPL')
+
+    assert len(demo_fetches) == 2
+    assert not any(tmp_path.iterdir())
+
+
+def test_demo_cache_serves_repeat_fetches(demo_fetches):
+    data, info = market_data.fetch_demo_stock('AAPL', use_cache=True)
+    cached, cached_info = market_data.fetch_demo_stock('AAPL', use_cache=True)
+
+    assert len(demo_fetches) == 1
+    pd.testing.assert_frame_equal(cached, data)
+    assert cached_info == info
+
+
+def test_corrupt_demo_cache_is_refetched(demo_fetches):
+    cache_path = market_data._demo_cache_path('AAPL', 2)
+    cache_path.write_bytes(b'not a pickle')
+
+    data, _ = market_data.fetch_demo_stock('AAPL', use_cache=True)
+    assert len(demo_fetches) == 1
+    pd.testing.assert_frame_equal(data, _ohlcv())
+
+    # The refetch replaced the corrupt file
+    market_data.fetch_demo_stock('AAPL', use_cache=True)
+    assert len(demo_fetches) == 1
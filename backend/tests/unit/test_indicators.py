@@ -0,0 +1,111 @@
+"""
+Unit tests for the technical indicators and their compiled kernels.
+
+Each fast path is compared against the plain pandas computation it replaces.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.strategy import indicators, kernels
+
+
+def _close(n=120, leading_nans=0):
+    rng = np.random.default_rng(1)
+    values = 100 + rng.standard_normal(n).cumsum()
+    values[:leading_nans] = np.nan
+    return pd.Series(
+        values,
+        index=pd.date_range('2024-01-01', periods=n, freq='D', name='Date'),
+        name='close'
+    )
+
+
+def _volume(n=120):
+    rng = np.random.default_rng(2)
+    return pd.Series(rng.integers(1_000, 10_000, n), index=_close(n).index, name='volume')
+
+
+def _assert_close(actual, expected):
+    pd.testing.assert_series_equal(actual, expected, check_exact=False, rtol=1e-9, check_freq=False)
+
+
+@pytest.mark.parametrize('leading_nans', [0, 5])
+@pytest.mark.parametrize('period', [1, 5, 20, 120, 150])
+def test_sma_matches_pandas(period, leading_nans):
+    close = _close(leading_nans=leading_nans)
+    expected = close.rolling(window=period, min_periods=period).mean()
+
+    _assert_close(indicators.sma(close, period), expected)
+
+
+@pytest.mark.parametrize('leading_nans', [0, 5])
+def test_sma_multi_matches_sma(leading_nans):
+    close = _close(leading_nans=leading_nans)
+    periods = [5, 20, 50, 150]
+
+    results = indicators.sma_multi(close, periods)
+
+    assert sorted(results) == periods
+    for period in periods:
+        _assert_close(results[period], indicators.sma(close, period))
+
+
+@pytest.mark.parametrize('leading_nans', [0, 5])
+@pytest.mark.parametrize('period', [1, 3, 20, 150])
+def test_rolling_extremes_match_pandas(period, leading_nans):
+    # Rounded prices repeat, which exercises ties in the deque
+    close = _close(leading_nans=leading_nans).round(0)
+    rolling = close.rolling(window=period, min_periods=period)
+
+    _assert_close(indicators.rolling_max(close, period), rolling.max())
+    _assert_close(indicators.rolling_min(close, period), rolling.min())
+
+
+@pytest.mark.parametrize('leading_nans', [0, 5])
+def test_obv_matches_pandas(leading_nans):
+    # Rounded prices include unchanged bars, which must add no volume
+    close = _close(leading_nans=leading_nans).round(0)
+    volume = _volume()
+    expected = (np.sign(close.diff()) * volume).cumsum()
+
+    result = indicators.obv(close, volume)
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+    assert result.index.equals(close.index)
+
+
+@pytest.mark.parametrize('period', [1, 10, 120, 150])
+def test_moving_average_kernel_matches_pandas(period):
+    close = _close()
+    values = close.to_numpy()
+
+    np.testing.assert_allclose(
+        kernels.moving_average_kernel(values, period, False),
+        close.rolling(window=period, min_periods=period).mean().to_numpy()
+    )
+    np.testing.assert_allclose(
+        kernels.moving_average_kernel(values, period, True),
+        close.ewm(span=period, adjust=False, min_periods=period).mean().to_numpy()
+    )
+
+
+@pytest.mark.parametrize('ma_type', ['sma', 'ema'])
+@pytest.mark.parametrize('fast_period, slow_period', [(5, 20), (10, 150)])
+def test_crossover_kernel_matches_pandas_strategy(monkeypatch, ma_type, fast_period, slow_period):
+    from app.services.strategy.examples import ma_crossover
+
+    data = pd.DataFrame({'close': _close(250)})
+    strategy = ma_crossover.MovingAverageCrossover({
+        'name': 'MA',
+        'parameters': {'fast_period': fast_period, 'slow_period': slow_period, 'ma_type': ma_type}
+    })
+
+    compiled = strategy.generate_signals(data)
+    monkeypatch.setattr(ma_crossover, 'NUMBA_AVAILABLE', False)
+    reference = strategy.generate_signals(data)
+
+    for column in ('fast_ma', 'slow_ma'):
+        np.testing.assert_allclose(compiled[column].to_numpy(), reference[column].to_numpy())
+    for column in ('signal', 'position'):
+        np.testing.assert_array_equal(compiled[column].to_numpy(), reference[column].to_numpy())
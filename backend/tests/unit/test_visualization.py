@@ -0,0 +1,72 @@
+"""
+Unit tests for the visualization services.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.backtesting.engine import BacktestEngine
+from app.services.strategy.examples.ma_crossover import MovingAverageCrossover
+from app.services.visualization import StrategyVisualizer
+
+
+@pytest.fixture(scope='module')
+def backtest():
+    rng = np.random.default_rng(0)
+    n = 120
+    close = 100 + rng.standard_normal(n).cumsum()
+    data = pd.DataFrame(
+        {
+            'open': close,
+            'high': close + 1.0,
+            'low': close - 1.0,
+            'close': close,
+            'volume': rng.integers(1_000, 10_000, n),
+        },
+        index=pd.date_range('2024-01-01', periods=n, freq='D', name='Date'),
+    )
+    strategy = MovingAverageCrossover({'name': 'MA', 'parameters': {'fast_period': 5, 'slow_period': 20}})
+    result = BacktestEngine().run_backtest(strategy, data, 'TEST')
+    return data, result.signals, result.metrics
+
+
+def _dashboard(visualizer, backtest, output_path):
+    data, signals, metrics = backtest
+    return visualizer.create_dashboard(
+        data, signals, metrics, 'MA',
+        output_path=str(output_path), auto_open=False, use_cache=True
+    )
+
+
+def test_dashboard_cache_skips_rendering(backtest, tmp_path, monkeypatch):
+    visualizer = StrategyVisualizer()
+    output_path = tmp_path / 'dashboard.html'
+    _dashboard(visualizer, backtest, output_path)
+    price_html = (tmp_path / 'dashboard_price.html').read_text()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("charts should come from the cache")
+
+    monkeypatch.setattr(visualizer, 'plot_price_and_signals', fail)
+    (tmp_path / 'dashboard_price.html').unlink()
+    _dashboard(visualizer, backtest, output_path)
+
+    assert (tmp_path / 'dashboard_price.html').read_text() == price_html
+
+
+def test_unreadable_dashboard_cache_renders_again(backtest, tmp_path):
+    visualizer = StrategyVisualizer()
+    data, signals, metrics = backtest
+
+    # A cache entry whose chart cannot be copied (a directory, not a file)
+    cache_key = visualizer._dashboard_cache_key(data, signals, metrics, 'MA')
+    cache_dir = tmp_path / 'cache' / cache_key
+    cache_dir.mkdir(parents=True)
+    for name in ('price.html', 'equity.html'):
+        (cache_dir / name).write_text('stale')
+    (cache_dir / 'metrics.html').mkdir()
+
+    _dashboard(visualizer, backtest, tmp_path / 'dashboard.html')
+
+    assert 'plotly' in (tmp_path / 'dashboard_price.html').read_text().lower()
+    assert (cache_dir / 'metrics.html').is_file()